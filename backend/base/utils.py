@@ -1,4 +1,14 @@
-from typing import Callable, TypeGuard
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import math
+import threading
+import time
+from typing import Callable, Iterator, TypeGuard
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
 
 
 class Maybe[T]:
@@ -42,3 +52,143 @@ class Maybe[T]:
 
     def is_none(self) -> bool:
         return self.value is None
+
+
+class TTLCache[K, V]:
+    """프로세스 내 LRU 캐시 (항목별 만료 시간 적용)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class HostRateLimiter:
+    """호스트별 요청 시작 간격을 보장하는 스레드 안전 리미터"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """같은 호스트의 이전 요청으로부터 interval초가 지날 때까지 대기"""
+        if self.interval <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수를 limit 이하로 제한하는 스레드 안전 리미터"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """같은 호스트의 동시 요청이 limit 미만이 될 때까지 대기 후 진입"""
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(
+                    self.limit
+                )
+        with semaphore:
+            yield
+
+
+class PooledHTTP:
+    """
+    호스트별 keep-alive 커넥션 풀을 공유하는 requests 세션 생성기
+
+    쿠키가 요청 간에 섞이지 않도록 세션은 요청마다 새로 만들고,
+    커넥션 풀(HTTPAdapter)만 공유하여 같은 호스트의 TCP/TLS 연결을 재사용한다.
+    HTTPAdapter의 커넥션 풀은 스레드 안전하므로 여러 스레드에서 함께 사용할 수 있다.
+    """
+
+    def __init__(self, pool_connections: int = 32, pool_maxsize: int = 8):
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+
+    def session(self) -> requests.Session:
+        """공유 커넥션 풀을 사용하는 새 세션 (close하면 공유 풀이 닫히므로 닫지 않음)"""
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """requests.get과 같지만 공유 커넥션 풀 사용"""
+        return self.session().get(url, **kwargs)
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (오탐은 error_rate 이하로 있을 수 있고 미탐은 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        # 두 개의 64비트 해시를 조합해 hash_count개의 위치 생성 (double hashing)
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value)
+        )
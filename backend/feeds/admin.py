@@ -1,3 +1,4 @@
+from celery import group
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import RSSCategory, RSSFeed, RSSItem
@@ -26,11 +27,9 @@ def make_hidden(modeladmin, request, queryset):
 
 @admin.action(description="Schedule update for selected feeds now")
 def schedule_update_now(modeladmin, request, queryset):
-    for feed in queryset:
-        update_feed_items.delay(feed.id)
-    modeladmin.message_user(
-        request, f"Scheduled updates for {queryset.count()} feed(s)"
-    )
+    feed_ids = list(queryset.values_list("id", flat=True))
+    group(update_feed_items.s(feed_id) for feed_id in feed_ids).apply_async()
+    modeladmin.message_user(request, f"Scheduled updates for {len(feed_ids)} feed(s)")
 
 
 @admin.register(RSSFeed)
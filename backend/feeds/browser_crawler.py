@@ -14,6 +14,8 @@ Requires the respective services to be running (see dev.compose.yml).
 import logging
 from typing import Optional
 
+from base.utils import PooledHTTP
+
 # Import from crawlers module
 try:
     from feeds.crawlers.base import clear_html_cache
@@ -39,6 +41,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive connection pool for plain HTTP fetches (reused across crawls)
+_http = PooledHTTP()
+
 # Global crawler instances (lazy initialization)
 _realbrowser_crawler: Optional[RealBrowserCrawler] = None
 _browserless_crawler: Optional[BrowserlessCrawler] = None
@@ -200,7 +205,11 @@ def fetch_html_smart(
         }
         default_headers.update(merged_headers)
 
-        response = requests.get(url, headers=default_headers, timeout=15)
+        response = _http.get(url, headers=default_headers, timeout=15)
+
+        # Conditional request (If-None-Match / If-Modified-Since) - unchanged
+        if response.status_code == 304:
+            return CrawlResult(success=True, url=url, not_modified=True)
 
         # Check for common bot detection responses
         if response.status_code == 200:
@@ -228,6 +237,8 @@ def fetch_html_smart(
                     success=True,
                     html=response.text,
                     url=response.url,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
                 )
             else:
                 logger.info(
@@ -20,6 +20,9 @@ class CrawlResult:
     error: Optional[str] = None
     url: Optional[str] = None  # Final URL after redirects
     from_cache: bool = False
+    etag: Optional[str] = None  # ETag response header (plain HTTP only)
+    last_modified: Optional[str] = None  # Last-Modified response header
+    not_modified: bool = False  # 304 response to a conditional request
 
 
 class WaitUntil(str, Enum):
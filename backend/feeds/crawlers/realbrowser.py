@@ -23,11 +23,15 @@ from urllib.parse import urlencode
 
 import requests
 
+from base.utils import PooledHTTP
 from .base import BaseBrowserCrawler
 from .abstract import CrawlResult, WaitUntil
 
 logger = logging.getLogger(__name__)
 
+# All requests go to the same browser service, so keep its connections alive
+_http = PooledHTTP(pool_connections=4, pool_maxsize=16)
+
 
 class RealBrowserCrawler(BaseBrowserCrawler):
     """
@@ -97,9 +101,7 @@ class RealBrowserCrawler(BaseBrowserCrawler):
 
             request_url = f"{self.service_url}?{urlencode(params)}"
             request_timeout = ((timeout or self.timeout) / 1000) + 30  # Add 30s buffer
-            response = requests.get(
-                request_url, timeout=request_timeout, headers=headers
-            )
+            response = _http.get(request_url, timeout=request_timeout, headers=headers)
 
             if response.status_code == 200:
                 # Debug: Log response content type and sample
@@ -203,7 +205,7 @@ class RealBrowserCrawler(BaseBrowserCrawler):
             request_url = f"{self.service_url}?{urlencode(params)}"
             request_timeout = ((timeout or self.timeout) / 1000) + 30 + (len(urls) * 10)
 
-            response = requests.get(request_url, timeout=request_timeout)
+            response = _http.get(request_url, timeout=request_timeout)
 
             if response.status_code == 200:
                 # Debug: Log response content type and sample
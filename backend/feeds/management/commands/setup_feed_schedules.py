@@ -1,9 +1,26 @@
 from django.core.management.base import BaseCommand
 from django_celery_beat.models import PeriodicTask, IntervalSchedule
-from feeds.models import RSSFeed
+from feeds.models import RSSFeed, RSSFeedSchedule
 import json
 
 
+def _link_schedule(feed, task):
+    """피드와 PeriodicTask 매핑 저장"""
+    RSSFeedSchedule.objects.update_or_create(
+        feed=feed, defaults={"periodic_task": task}
+    )
+
+
+def remove_feed_schedule_tasks(feed):
+    """
+    피드의 스케줄 task 삭제
+    매핑과 이름(unique)으로 찾고, 매핑이 없는 예전 스케줄만 args 기준으로 찾습니다.
+    """
+    if not PeriodicTask.objects.filter(feed_schedules__feed_id=feed.pk).delete()[0]:
+        PeriodicTask.objects.filter(args=json.dumps([feed.pk])).delete()
+    PeriodicTask.objects.filter(name=f"Update RSS feed: {feed.title}").delete()
+
+
 def setup_feed_schedules():
     """
     Setup periodic tasks for RSS feed updates using Celery Beat
@@ -40,17 +57,15 @@ def setup_feed_schedules():
             task.enabled = True
             task.save()
 
+        _link_schedule(feed, task)
+
 
 def setup_feed_schedule(feed):
     """
     특정 피드에 대한 스케줄 생성/업데이트
     """
     if not feed.visible or feed.refresh_interval <= 0:
-        # 스케줄 제거: 제목이 바뀌었거나 중복이 있을 수 있으므로 args (feed.pk) 기준으로 삭제
-        args_payload = json.dumps([feed.pk])
-        PeriodicTask.objects.filter(args=args_payload).delete()
-        # 기존 이름 기준으로도 한 번 더 삭제 (안전성)
-        PeriodicTask.objects.filter(name=f"Update RSS feed: {feed.title}").delete()
+        remove_feed_schedule_tasks(feed)
         return
 
     # Interval schedule 생성 또는 가져오기
@@ -64,6 +79,20 @@ def setup_feed_schedule(feed):
     # 먼저 같은 피드 ID로 이미 존재하는 task가 있는지 확인합니다.
     # (피드 제목 변경 시 기존 task의 name이 달라져 중복 생성되는 것을 방지)
     args_payload = json.dumps([feed.pk])
+    # 매핑된 task가 있으면 args를 훑지 않고 그것을 갱신
+    mapping = (
+        RSSFeedSchedule.objects.select_related("periodic_task").filter(feed=feed).first()
+    )
+    if mapping:
+        task = mapping.periodic_task
+        task.name = task_name
+        task.task = "feeds.tasks.update_feed_items"
+        task.interval = schedule
+        task.args = args_payload
+        task.enabled = True
+        task.save()
+        return
+
     existing_tasks = PeriodicTask.objects.filter(args=args_payload)
 
     if existing_tasks.exists():
@@ -81,6 +110,7 @@ def setup_feed_schedule(feed):
         # 동일 args를 가진 추가 항목이 있다면 정리 (중복 제거)
         if existing_tasks.count() > 1:
             existing_tasks.exclude(id=task.pk).delete()
+        _link_schedule(feed, task)
         return
 
     # 없으면 이름으로 새로 생성
@@ -101,6 +131,8 @@ def setup_feed_schedule(feed):
         task.enabled = True
         task.save()
 
+    _link_schedule(feed, task)
+
 
 class Command(BaseCommand):
     help = "Setup periodic tasks for RSS feed updates using Celery Beat"
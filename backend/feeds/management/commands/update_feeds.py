@@ -1,5 +1,7 @@
 from django.core.management.base import BaseCommand
 from feeds.models import RSSFeed, RSSItem
+from feeds.services.item import ItemService
+from feeds.tasks import ITEM_FLUSH_SIZE
 from feeds.utils.html_utils import strip_html_tags
 import feedparser
 import requests
@@ -73,12 +75,10 @@ class Command(BaseCommand):
             feed.description = parsed_feed.feed.description
 
         feed.last_updated = timezone.now()
-        feed.save()
+        feed.save(update_fields=["title", "description", "last_updated"])
 
         # 새로운 아이템들 추가
-        existing_guids = set(
-            RSSItem.objects.filter(feed=feed).values_list("guid", flat=True)
-        )
+        existing_guids = ItemService.existing_guids(feed.pk)
 
         new_items = []
         for entry in parsed_feed.entries:
@@ -109,5 +109,8 @@ class Command(BaseCommand):
 
         # 벌크 생성
         if new_items:
-            RSSItem.objects.bulk_create(new_items)
+            # 피드+GUID 중복은 건너뛰고 ITEM_FLUSH_SIZE 단위로 나눠 INSERT
+            RSSItem.objects.bulk_create(
+                new_items, batch_size=ITEM_FLUSH_SIZE, ignore_conflicts=True
+            )
             self.stdout.write(f"Added {len(new_items)} new items to {feed.title}")
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-16 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feeds', '0018_add_default_to_selectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rsseverythingsource',
+            name='http_etag',
+            field=models.CharField(blank=True, default='', help_text='마지막 응답의 ETag', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='rsseverythingsource',
+            name='http_last_modified',
+            field=models.CharField(blank=True, default='', help_text='마지막 응답의 Last-Modified', max_length=64),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-16 18:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feeds', '0019_add_http_validators_to_source'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rssitem',
+            name='guid',
+            field=models.CharField(max_length=500),
+        ),
+        migrations.AddConstraint(
+            model_name='rssitem',
+            constraint=models.UniqueConstraint(fields=('feed', 'guid'), name='uniq_feed_guid'),
+        ),
+    ]
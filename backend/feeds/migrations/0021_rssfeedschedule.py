@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-16 19:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+        ('feeds', '0020_feed_scoped_item_guid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RSSFeedSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feed', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='schedule', to='feeds.rssfeed')),
+                ('periodic_task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_schedules', to='django_celery_beat.periodictask')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
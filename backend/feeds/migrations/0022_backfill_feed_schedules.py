@@ -0,0 +1,58 @@
+# Generated manually for data migration
+
+import json
+
+from django.db import migrations
+
+
+def parse_feed_id(raw_args):
+    """태스크 args(JSON 문자열)에서 피드 ID 추출"""
+    try:
+        args = json.loads(raw_args) if raw_args else []
+        if args:
+            return int(args[0])
+    except (json.JSONDecodeError, ValueError, TypeError):
+        pass
+    return None
+
+
+def backfill_feed_schedules(apps, schema_editor):
+    """기존 PeriodicTask args로 매핑이 없는 피드의 RSSFeedSchedule 생성"""
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+    RSSFeed = apps.get_model('feeds', 'RSSFeed')
+    RSSFeedSchedule = apps.get_model('feeds', 'RSSFeedSchedule')
+
+    mapped_feed_ids = set(RSSFeedSchedule.objects.values_list('feed_id', flat=True))
+    feed_titles = dict(RSSFeed.objects.values_list('id', 'title'))
+
+    # 피드마다 하나의 task만 매핑 (이름이 현재 제목과 같은 task 우선, 없으면 가장 먼저 만든 task)
+    task_by_feed = {}
+    tasks = PeriodicTask.objects.filter(
+        task='feeds.tasks.update_feed_items'
+    ).order_by('id').values_list('id', 'name', 'args')
+    for task_id, name, raw_args in tasks.iterator():
+        feed_id = parse_feed_id(raw_args)
+        if feed_id not in feed_titles or feed_id in mapped_feed_ids:
+            continue
+        if feed_id not in task_by_feed or name == f"Update RSS feed: {feed_titles[feed_id]}":
+            task_by_feed[feed_id] = task_id
+
+    RSSFeedSchedule.objects.bulk_create(
+        [
+            RSSFeedSchedule(feed_id=feed_id, periodic_task_id=task_id)
+            for feed_id, task_id in task_by_feed.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+        ('feeds', '0021_rssfeedschedule'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_feed_schedules, migrations.RunPython.noop),
+    ]
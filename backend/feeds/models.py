@@ -119,7 +119,7 @@ class RSSItem(BaseModel):
     )
     image = models.URLField(blank=True, default="", help_text="아이템 이미지 URL")
     published_at = models.DateTimeField()
-    guid = models.CharField(max_length=500, unique=True)
+    guid = models.CharField(max_length=500)
     is_read = models.BooleanField(default=False)
     is_favorite = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -134,6 +134,10 @@ class RSSItem(BaseModel):
             models.Index(fields=["published_at"]),
             models.Index(fields=["feed", "-published_at"]),
         ]
+        constraints = [
+            # 같은 글이라도 피드마다 따로 저장 (중복 삽입은 bulk_create의 ignore_conflicts로 건너뜀)
+            models.UniqueConstraint(fields=["feed", "guid"], name="uniq_feed_guid"),
+        ]
 
     def __str__(self):
         return self.title
@@ -286,6 +290,13 @@ class RSSEverythingSource(BaseModel):
 
     last_crawled_at = models.DateTimeField(null=True, blank=True)
     last_error = models.TextField(blank=True, default="")
+    # 조건부 요청(If-None-Match / If-Modified-Since)용 마지막 응답 검증자
+    http_etag = models.CharField(
+        max_length=255, blank=True, default="", help_text="마지막 응답의 ETag"
+    )
+    http_last_modified = models.CharField(
+        max_length=64, blank=True, default="", help_text="마지막 응답의 Last-Modified"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -308,6 +319,16 @@ class RSSEverythingSource(BaseModel):
     def is_rss(self) -> bool:
         return self.source_type == self.SourceType.RSS
 
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """마지막 응답 검증자로 만든 조건부 요청 헤더"""
+        headers = {}
+        if self.http_etag:
+            headers["If-None-Match"] = self.http_etag
+        if self.http_last_modified:
+            headers["If-Modified-Since"] = self.http_last_modified
+        return headers
+
     @property
     def is_scraping(self) -> bool:
         return self.source_type in [
@@ -391,3 +412,22 @@ class FeedTaskResult(BaseModel):
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
+
+
+class RSSFeedSchedule(BaseModel):
+    """
+    피드와 Celery beat PeriodicTask의 매핑
+    인덱스가 없는 PeriodicTask.args를 훑지 않고 피드의 스케줄을 찾기 위해 사용합니다.
+    """
+
+    feed = models.OneToOneField(
+        RSSFeed, on_delete=models.CASCADE, related_name="schedule"
+    )
+    periodic_task = models.ForeignKey(
+        "django_celery_beat.PeriodicTask",
+        on_delete=models.CASCADE,
+        related_name="feed_schedules",
+    )
+
+    def __str__(self):
+        return f"{self.feed_id} -> {self.periodic_task_id}"
@@ -19,6 +19,8 @@ from feeds.schemas import (
     SourceCreateSchema,
     SourceUpdateSchema,
     RefreshResponse,
+    RefreshManyRequest,
+    RefreshManyResponse,
     PaginationCrawlRequest,
     PaginationCrawlResponse,
 )
@@ -39,6 +41,7 @@ def fetch_html(request, data: FetchHTMLRequest):
         wait_selector=data.wait_selector,
         timeout=data.timeout,
         custom_headers=data.custom_headers if data.custom_headers else None,
+        memoize=True,
     )
     return result
 
@@ -69,7 +72,9 @@ def extract_elements(request, data: ExtractElementsRequest):
 )
 def crawl(request, data: CrawlRequest):
     """설정된 셀렉터로 아이템들을 미리보기"""
-    entries, result = SourceService.crawl(data, max_items=5)
+    entries, result = SourceService.crawl(
+        data, max_items=5, prefer_http=True, memoize=True
+    )
     return dict(success=True, items=result, count=len(result))
 
 
@@ -155,9 +160,7 @@ def create_source(request, data: SourceCreateSchema):
 )
 def update_source_rss(request, source_id: int, data: SourceUpdateSchema):
     """RSSEverything 소스 수정"""
-    source = SourceService.update_source(
-        request.auth, source_id, data.dict(exclude_unset=True)
-    )
+    source = SourceService.update_source(request.auth, source_id, data)
     return source
 
 
@@ -168,6 +171,22 @@ def delete_source_rss(request, source_id: int):
     return {"success": True}
 
 
+@router.post(
+    "/refresh",
+    response=RefreshManyResponse,
+    auth=JWTAuth(),
+    operation_id="refreshRssEverythingSources",
+)
+def refresh_sources(request, data: RefreshManyRequest):
+    """여러 RSSEverything 소스를 한 번에 새로고침"""
+    task_result_ids = SourceService.refresh_sources(request.auth, data.source_ids)
+    return RefreshManyResponse(
+        success=True,
+        task_result_ids=task_result_ids,
+        message=f"Refresh tasks started for {len(task_result_ids)} feeds",
+    )
+
+
 @router.post(
     "/{source_id}/refresh",
     response=RefreshResponse,
@@ -29,6 +29,8 @@ from .source import (
     SourceCreateSchema,
     SourceUpdateSchema,
     RefreshResponse,
+    RefreshManyRequest,
+    RefreshManyResponse,
     PaginationCrawlRequest,
     PaginationCrawlResponse,
 )
@@ -77,6 +79,8 @@ __all__ = [
     "RSSEverythingCreateRequest",
     "RSSEverythingUpdateRequest",
     "RefreshResponse",
+    "RefreshManyRequest",
+    "RefreshManyResponse",
     # Item
     "ItemSchema",
     "ItemFilterSchema",
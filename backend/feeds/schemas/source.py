@@ -135,6 +135,8 @@ class SourceCreateSchema(ModelSchema):
             "is_active",
             "last_crawled_at",
             "last_error",
+            "http_etag",
+            "http_last_modified",
             "created_at",
             "updated_at",
             "date_formats",
@@ -161,6 +163,8 @@ class SourceUpdateSchema(ModelSchema):
             "is_active",
             "last_crawled_at",
             "last_error",
+            "http_etag",
+            "http_last_modified",
             "created_at",
             "updated_at",
             "date_formats",
@@ -200,6 +204,20 @@ class RefreshResponse(BaseModel):
     message: str
 
 
+class RefreshManyRequest(BaseModel):
+    """여러 소스 새로고침 요청"""
+
+    source_ids: list[int]
+
+
+class RefreshManyResponse(BaseModel):
+    """여러 소스 새로고침 응답"""
+
+    success: bool
+    task_result_ids: list[int]
+    message: str
+
+
 class PaginationCrawlRequest(BaseModel):
     """페이지네이션 크롤링 요청
 
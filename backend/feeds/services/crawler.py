@@ -2,18 +2,43 @@
 Crawler Service - 소스 타입별 크롤링 로직을 통합 관리
 """
 
+import itertools
+import re
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from time import struct_time
 from datetime import date, datetime, timezone
 from typing import Any, Callable, Optional, Tuple, List, Set
-from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+import feedparser
+from feedparser import FeedParserDict
 from django.utils import timezone as django_timezone
 
-from base.utils import Maybe
+from base.utils import HostConcurrencyLimiter, Maybe, TTLCache
 from feeds.schemas.source import CrawlRequest
 from feeds.utils.date_parser import parse_date
-from feeds.utils.html_parser import extract_src, extract_html_with_css
+from feeds.utils.html_parser import (
+    HTML_PARSER,
+    STREAMING_PARSE_THRESHOLD,
+    LexborNode,
+    compile_selector,
+    extract_css_from_html,
+    extract_src,
+    extract_html_with_css,
+    first_img_src,
+    join_url,
+    lexbor_href,
+    lexbor_select_one,
+    lexbor_src,
+    lexbor_text,
+    parse_lexbor,
+    parse_lexbor_fragment,
+    parse_simple_selector,
+    remove_elements,
+    select_elements,
+    selectors_depend_on_tbody,
+    stream_item_fragments,
+)
 from feeds.utils.html_utils import strip_html_tags
 from feeds.browser_crawler import fetch_html_with_browser, fetch_html_smart
 
@@ -22,6 +47,22 @@ from feeds.models import RSSEverythingSource, RSSFeed, RSSItem
 
 logger = getLogger(__name__)
 
+# 셀렉터 튜닝 중 같은 URL 반복 요청을 줄이기 위한 프로세스 내 단기 캐시
+# (편집 화면 경로에서만 memoize=True로 사용하며 예약 크롤링은 항상 새로 가져옴)
+FETCH_CACHE_MAXSIZE = 256
+FETCH_CACHE_TTL = 60  # 초
+_fetch_cache: TTLCache[tuple, Any] = TTLCache(FETCH_CACHE_MAXSIZE, FETCH_CACHE_TTL)
+
+# 상세 페이지를 동시에 가져올 최대 수
+DETAIL_MAX_WORKERS = 4
+# 프로세스 전체에서 같은 호스트로 동시에 보낼 상세 페이지 요청 수
+# (페이지네이션 task처럼 여러 목록 페이지를 동시에 처리해도 호스트별로는 이 수를 넘지 않음)
+DETAIL_MAX_PER_HOST = 4
+_detail_host_limiter = HostConcurrencyLimiter(DETAIL_MAX_PER_HOST)
+
+# description에 <img> 태그가 있을 때만 HTML 파싱
+_IMG_TAG_RE = re.compile(r"<img\b", re.IGNORECASE)
+
 
 class CrawlerService:
     """소스 타입별 크롤링 로직을 통합 관리하는 서비스"""
@@ -39,10 +80,30 @@ class CrawlerService:
         timeout: int = 30000,
         custom_headers: Optional[dict] = None,
         use_cache: bool = True,
+        memoize: bool = False,
     ):
-        """URL에서 HTML을 가져옴"""
+        """
+        URL에서 HTML을 가져옴
+
+        memoize=True면 프로세스 내 단기 캐시를 우선 사용한다. 셀렉터 편집처럼
+        같은 페이지를 반복 요청하는 경로용이며, use_cache=False면 사용하지 않는다.
+        """
+        memoize = memoize and use_cache
+        cache_key = (
+            url,
+            use_browser,
+            browser_service,
+            wait_selector,
+            timeout,
+            tuple(sorted((custom_headers or {}).items())),
+        )
+        if memoize:
+            cached = _fetch_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if use_browser:
-            return fetch_html_with_browser(
+            result = fetch_html_with_browser(
                 url=url,
                 selector=wait_selector,
                 timeout=timeout,
@@ -51,7 +112,7 @@ class CrawlerService:
                 use_cache=use_cache,
             )
         else:
-            return fetch_html_smart(
+            result = fetch_html_smart(
                 url=url,
                 use_browser_on_fail=True,
                 browser_selector=wait_selector,
@@ -59,6 +120,10 @@ class CrawlerService:
                 browser_service=browser_service,
             )
 
+        if memoize and result.success and not result.not_modified:
+            _fetch_cache.set(cache_key, result)
+        return result
+
     @staticmethod
     def fetch_html_for_source(
         option: CrawlRequest, url: Optional[str] = None, use_cache: bool = True
@@ -85,52 +150,61 @@ class CrawlerService:
         soup: BeautifulSoup,
         existing_guids: Set[str],
         max_items: int = 30,
+        items: Optional[list] = None,
     ) -> list[RSSItem]:
         """
         목록 페이지에서 아이템을 파싱하여 RSSItem 객체 리스트 반환
         PAGE_SCRAPING과 페이지네이션 크롤링에서 공통으로 사용
-        """
-        from feeds.models import RSSItem
 
-        # exclude_selectors 적용
-        if option.exclude_selectors:
-            for exclude_selector in option.exclude_selectors:
-                for el in soup.select(exclude_selector):
-                    el.decompose()
+        items를 넘기면 제외 셀렉터가 이미 적용된 soup에서 선택한 아이템으로 보고
+        제외/아이템 선택을 다시 하지 않는다.
+        """
+        if items is not None:
+            items = items[:max_items]
+        else:
+            # exclude_selectors 적용
+            if option.exclude_selectors:
+                remove_elements(soup, option.exclude_selectors)
+
+            # 아이템 선택
+            items = (
+                select_elements(soup, option.item_selector, limit=max_items)
+                if option.item_selector
+                else []
+            )
 
-        # 아이템 선택
-        items = soup.select(option.item_selector) if option.item_selector else []
+        # 필드 셀렉터는 아이템마다 다시 해석하지 않도록 루프 전에 한 번만 컴파일
+        title_sel, link_sel, desc_sel, date_sel, author_sel, image_sel = (
+            compile_selector(selector) if selector else None
+            for selector in (
+                option.title_selector,
+                option.link_selector,
+                option.description_selector,
+                option.date_selector,
+                option.author_selector,
+                option.image_selector,
+            )
+        )
 
-        # web_scraper 모듈 사용하여 아이템 추출
+        url = option.url
+        # 문서 CSS는 모든 아이템에 같으므로 설명이 처음 나올 때 한 번만 추출
+        page_css: Optional[str] = None
         crawled_items = []
 
-        for item in items[:max_items]:
-            # 제목 추출
-            title = ""
-            title_el = (
-                item.select_one(option.title_selector)
-                if option.title_selector
-                else None
-            )
-            if title_el:
-                title = title_el.get_text(strip=True)
+        for item in items:
+            title_el = title_sel.select_one(item) if title_sel else None
+            link_el = link_sel.select_one(item) if link_sel else title_el
 
-            # title_selector가 없으면 link_selector에서 제목 추출
-            if not title and option.link_selector:
-                link_el = item.select_one(option.link_selector)
-                if link_el:
-                    title = link_el.get_text(strip=True)
+            # 제목 추출 (title_selector가 없으면 link_selector에서 제목 추출)
+            title = title_el.get_text(strip=True) if title_el else ""
+            if not title and link_sel and link_el:
+                title = link_el.get_text(strip=True)
 
             if not title:
                 continue
 
             # 링크 추출
             link = ""
-            if option.link_selector:
-                link_el = item.select_one(option.link_selector)
-            else:
-                link_el = title_el
-
             if link_el:
                 href = link_el.get("href")
                 if not href:
@@ -138,40 +212,32 @@ class CrawlerService:
                     if a_tag:
                         href = a_tag.get("href")
                 if href:
-                    link = urljoin(option.url, Maybe.of(href).instanceof(str))
+                    link = join_url(url, Maybe.of(href).instanceof(str))
 
             # GUID 생성
-            guid = link if link else f"{option.url}#{title[:100]}"
+            guid = link if link else f"{url}#{title[:100]}"
             if guid in existing_guids:
                 continue
 
             # 설명 추출 (HTML 블록 + CSS 포함)
             description = ""
-            if option.description_selector:
-                desc_el = item.select_one(option.description_selector)
-                if desc_el:
-                    description = extract_html_with_css(desc_el, soup, option.url)
+            desc_el = desc_sel.select_one(item) if desc_sel else None
+            if desc_el:
+                if page_css is None:
+                    page_css = extract_css_from_html(soup, url)
+                description = extract_html_with_css(desc_el, soup, url, css=page_css)
 
             # 날짜 추출
-            date = ""
-            if option.date_selector:
-                date_el = item.select_one(option.date_selector)
-                if date_el:
-                    date = date_el.get_text(strip=True)
+            date_el = date_sel.select_one(item) if date_sel else None
+            date = date_el.get_text(strip=True) if date_el else ""
 
             # 작성자 추출
-            author = ""
-            if option.author_selector:
-                author_el = item.select_one(option.author_selector)
-                if author_el:
-                    author = author_el.get_text(strip=True)[:255]
+            author_el = author_sel.select_one(item) if author_sel else None
+            author = author_el.get_text(strip=True)[:255] if author_el else ""
 
             # 이미지 추출
-            image = ""
-            if option.image_selector:
-                img_el = item.select_one(option.image_selector)
-                if img_el:
-                    image = extract_src(img_el, option.url)
+            img_el = image_sel.select_one(item) if image_sel else None
+            image = extract_src(img_el, url) if img_el else ""
 
             crawled_items.append(
                 {
@@ -185,13 +251,20 @@ class CrawlerService:
                 }
             )
 
-        # 딕셔너리 → RSSItem 객체 변환
+        return CrawlerService._build_list_items(option, crawled_items)
+
+    @staticmethod
+    def _build_list_items(
+        option: CrawlRequest, crawled_items: list[dict]
+    ) -> list[RSSItem]:
+        """목록 페이지에서 추출한 딕셔너리 → RSSItem 객체 변환"""
+        date_formats = option.date_formats
         new_items = []
         for item in crawled_items:
             # 날짜 파싱
             published_at = django_timezone.now()
-            if item["date"] and option.date_formats:
-                parsed_date = parse_date(item["date"], option.date_formats)
+            if item["date"] and date_formats:
+                parsed_date = parse_date(item["date"], date_formats)
                 if parsed_date:
                     published_at = parsed_date
 
@@ -210,6 +283,154 @@ class CrawlerService:
 
         return new_items
 
+    @staticmethod
+    def fast_parse_list_page_items(
+        option: CrawlRequest,
+        html: str,
+        existing_guids: Set[str],
+        max_items: int = 30,
+    ) -> Optional[Tuple[int, list[RSSItem]]]:
+        """
+        selectolax(lexbor)로 목록 페이지를 파싱하는 빠른 경로
+
+        텍스트/href/src만 필요한 경우에 사용하며, 설명 HTML 직렬화가 필요하거나
+        selectolax를 사용할 수 없으면 None을 반환하여 BeautifulSoup 경로로 넘긴다.
+        """
+        if option.description_selector or not option.item_selector:
+            return None
+
+        try:
+            tree = parse_lexbor(
+                html, option.exclude_selectors, CrawlerService._list_selectors(option)
+            )
+            if tree is None:
+                return None
+            items = tree.css(option.item_selector)
+
+            extract = CrawlerService._lexbor_item_extractor(option, existing_guids)
+            crawled_items = []
+            for item in items[:max_items]:
+                crawled = extract(item)
+                if crawled:
+                    crawled_items.append(crawled)
+        except Exception:
+            # lexbor가 지원하지 않는 셀렉터 등은 BeautifulSoup 경로로 처리
+            logger.debug(f"selectolax could not handle selectors for {option.url}")
+            return None
+
+        return len(items), CrawlerService._build_list_items(option, crawled_items)
+
+    @staticmethod
+    def stream_parse_list_page_items(
+        option: CrawlRequest,
+        html: str,
+        existing_guids: Set[str],
+        max_items: int = 30,
+    ) -> Optional[Tuple[int, list[RSSItem]]]:
+        """
+        매우 큰 목록 페이지를 lxml 풀 파서로 아이템 단위로 스트리밍 파싱
+
+        전체 트리를 만들지 않고 아이템 요소 HTML만 하나씩 lexbor로 파싱한다.
+        단순 아이템 셀렉터이면서 설명/제외 셀렉터가 없는 큰 페이지에서만 사용하며,
+        조건에 맞지 않으면 None을 반환하여 일반 경로로 넘긴다.
+        (아이템 안의 표는 lexbor가 tbody를 넣으므로 하위 셀렉터가 tbody 유무에 의존하면 제외)
+        """
+        if (
+            len(html) <= STREAMING_PARSE_THRESHOLD
+            or option.description_selector
+            or option.exclude_selectors
+            or not option.item_selector
+            or parse_simple_selector(option.item_selector) is None
+            or selectors_depend_on_tbody(CrawlerService._list_selectors(option)[1:])
+        ):
+            return None
+
+        try:
+            fragments = stream_item_fragments(html, option.item_selector)
+            if fragments is None:
+                return None
+
+            item_selector = option.item_selector
+            extract = CrawlerService._lexbor_item_extractor(option, existing_guids)
+            total = 0
+            crawled_items = []
+            for fragment, parent_tag in fragments:
+                total += 1
+                if total > max_items:
+                    # 전체 아이템 수만 센다
+                    continue
+                tree = parse_lexbor_fragment(fragment, parent_tag)
+                item = tree.css_first(item_selector) if tree else None
+                if item is None:
+                    continue
+                crawled = extract(item)
+                if crawled:
+                    crawled_items.append(crawled)
+        except Exception:
+            logger.debug(f"Streaming parse failed for {option.url}")
+            return None
+
+        return total, CrawlerService._build_list_items(option, crawled_items)
+
+    @staticmethod
+    def _list_selectors(option: CrawlRequest) -> list[str]:
+        """목록 페이지 파싱에 쓰는 셀렉터들 (lexbor/BeautifulSoup 트리 차이 확인용)"""
+        return [
+            option.item_selector,
+            option.title_selector,
+            option.link_selector,
+            option.date_selector,
+            option.author_selector,
+            option.image_selector,
+        ]
+
+    @staticmethod
+    def _lexbor_item_extractor(
+        option: CrawlRequest, existing_guids: Set[str]
+    ) -> Callable[[LexborNode], Optional[dict]]:
+        """
+        lexbor 아이템 노드에서 목록 필드를 추출하는 함수 생성
+
+        옵션 필드는 여기서 한 번만 읽어 지역 변수로 두고, 반환된 함수는 아이템마다
+        그 값만 사용한다. 제목이 없거나 이미 있는 아이템이면 None을 반환한다.
+        """
+        url = option.url
+        title_selector = option.title_selector
+        link_selector = option.link_selector
+        date_selector = option.date_selector
+        author_selector = option.author_selector
+        image_selector = option.image_selector
+
+        def extract(item: LexborNode) -> Optional[dict]:
+            title_el = lexbor_select_one(item, title_selector)
+            link_el = (
+                lexbor_select_one(item, link_selector) if link_selector else title_el
+            )
+
+            title = lexbor_text(title_el)
+            if not title and link_selector:
+                title = lexbor_text(link_el)
+
+            if not title:
+                return None
+
+            link = lexbor_href(link_el, url)
+            guid = link if link else f"{url}#{title[:100]}"
+            if guid in existing_guids:
+                return None
+
+            return {
+                "title": title,
+                "link": link,
+                "description": "",
+                "date": lexbor_text(lexbor_select_one(item, date_selector)),
+                "guid": guid,
+                "author": lexbor_text(lexbor_select_one(item, author_selector))[:255],
+                "image": lexbor_src(lexbor_select_one(item, image_selector), url),
+            }
+
+        return extract
+
     @staticmethod
     def parse_detail_page(
         option: CrawlRequest,
@@ -223,21 +444,23 @@ class CrawlerService:
         # 제목
         title = list_data.get("title", "")
         if option.detail_title_selector:
-            title_el = soup.select_one(option.detail_title_selector)
+            title_el = compile_selector(option.detail_title_selector).select_one(soup)
             if title_el:
                 title = title_el.get_text(strip=True)[:199]
 
         # 설명/본문 (CSS 포함)
         description = ""
+        desc_el = None
         if option.detail_description_selector:
-            desc_el = soup.select_one(option.detail_description_selector)
+            desc_sel = compile_selector(option.detail_description_selector)
+            desc_el = desc_sel.select_one(soup)
             if desc_el:
                 description = extract_html_with_css(desc_el, soup, detail_url)
 
         # 날짜
         date_str = list_data.get("date", "")
         if option.detail_date_selector:
-            date_el = soup.select_one(option.detail_date_selector)
+            date_el = compile_selector(option.detail_date_selector).select_one(soup)
             if date_el:
                 date_str = date_el.get_text(strip=True)
             print(f"Extracted date string: {date_str}")
@@ -245,18 +468,17 @@ class CrawlerService:
         # 이미지
         image = list_data.get("image", "")
         if option.detail_image_selector:
-            img_el = soup.select_one(option.detail_image_selector)
+            img_el = compile_selector(option.detail_image_selector).select_one(soup)
             if img_el:
                 image = img_el.get("src") or img_el.get("data-src") or ""
                 if image:
-                    image = urljoin(detail_url, image)  # type:ignore
+                    image = join_url(detail_url, image)  # type:ignore
 
-        # 이미지가 없으면 description에서 추출
-        if not image and description:
-            desc_soup = BeautifulSoup(description, "html.parser")
-            img_tag = desc_soup.find("img")
+        # 이미지가 없으면 description에서 추출 (직렬화된 HTML을 다시 파싱하지 않고 원본 요소 사용)
+        if not image and desc_el:
+            img_tag = desc_el if desc_el.name == "img" else desc_el.find("img")
             if img_tag and img_tag.get("src"):
-                image = urljoin(detail_url, img_tag.get("src"))  # type:ignore
+                image = join_url(detail_url, img_tag.get("src"))  # type:ignore
 
         # 날짜 파싱
         published_at = django_timezone.now()
@@ -293,10 +515,6 @@ class CrawlerService:
         Returns:
             (items_found, new_items): 발견된 아이템 수와 새 RSSItem 객체 리스트
         """
-        from feeds.models import RSSItem
-        import feedparser
-        from feedparser import FeedParserDict
-
         feed_data = feedparser.parse(html)
 
         new_items = []
@@ -363,11 +581,13 @@ class CrawlerService:
                         break
 
             # RSS에 이미지가 없으면 description에서 추출
-            if not image and description and isinstance(description, str):
-                desc_soup = BeautifulSoup(description, "html.parser")
-                img_tag = desc_soup.find("img")
-                if img_tag and img_tag.get("src"):
-                    image = img_tag.get("src")
+            if (
+                not image
+                and description
+                and isinstance(description, str)
+                and _IMG_TAG_RE.search(description)
+            ):
+                image = first_img_src(description)
 
             new_items.append(
                 RSSItem(
@@ -410,20 +630,23 @@ class CrawlerService:
         Returns:
             (items_found, new_items): 발견된 아이템 수와 새 RSSItem 객체 리스트
         """
+        # 제외 셀렉터 적용 후 아이템을 한 번만 선택해 파싱과 개수 계산에 함께 사용
+        if option.exclude_selectors:
+            remove_elements(soup, option.exclude_selectors)
+        items = (
+            select_elements(soup, option.item_selector) if option.item_selector else []
+        )
+
         # 아이템 파싱
         new_items = CrawlerService.parse_list_page_items(
-            option, soup, existing_guids, max_items
+            option, soup, existing_guids, max_items, items=items
         )
 
         # feed 설정
         for item in new_items:
             callback(item)
 
-        items_found = (
-            len(soup.select(option.item_selector)) if option.item_selector else 0
-        )
-
-        return items_found, new_items
+        return len(items), new_items
 
     # ==========================================
     # 상세 페이지 스크래핑 - 목록 URL 추출
@@ -446,29 +669,40 @@ class CrawlerService:
 
         # exclude_selectors 적용
         if option.exclude_selectors:
-            for exclude_selector in option.exclude_selectors:
-                for el in soup.select(exclude_selector):
-                    el.decompose()
+            remove_elements(soup, option.exclude_selectors)
+
+        items = (
+            select_elements(soup, option.item_selector, limit=max_items)
+            if option.item_selector
+            else []
+        )
 
-        items = soup.select(option.item_selector) if option.item_selector else []
+        # 필드 selector는 아이템마다 다시 조회하지 않도록 한 번만 준비
+        link_sel = (
+            compile_selector(option.link_selector) if option.link_selector else None
+        )
+        title_sel = (
+            compile_selector(option.title_selector) if option.title_selector else None
+        )
+        date_sel = (
+            compile_selector(option.date_selector) if option.date_selector else None
+        )
+        image_sel = (
+            compile_selector(option.image_selector) if option.image_selector else None
+        )
 
         detail_tasks_data = []
-        for item in items[:max_items]:
-            # 링크 추출
+        for item in items:
+            # 링크 추출 (selector가 없으면 soupsieve를 거치지 않고 첫 a 태그를 직접 탐색)
             link = None
-            if option.link_selector:
-                link_el = item.select_one(option.link_selector)
-                if link_el:
-                    link = link_el.get("href")
-            else:
-                link_el = item.select_one("a")
-                if link_el:
-                    link = link_el.get("href")
+            link_el = link_sel.select_one(item) if link_sel else item.find("a")
+            if link_el:
+                link = link_el.get("href")
 
             if not link:
                 continue
 
-            link = urljoin(option.url, Maybe.of(link).instanceof(str))
+            link = join_url(option.url, Maybe.of(link).instanceof(str))
             print("Extracted detail link:", link)
             # 이미 존재하면 스킵
             if link[:499] in existing_guids:
@@ -477,24 +711,24 @@ class CrawlerService:
             # 목록에서 추출 가능한 정보
             list_data = {"title": "", "date": "", "image": ""}
 
-            if option.title_selector:
-                title_el = item.select_one(option.title_selector)
+            if title_sel:
+                title_el = title_sel.select_one(item)
                 if title_el:
                     list_data["title"] = title_el.get_text(strip=True)[:199]
 
-            if option.date_selector:
-                date_el = item.select_one(option.date_selector)
+            if date_sel:
+                date_el = date_sel.select_one(item)
                 if date_el:
                     list_data["date"] = date_el.get_text(strip=True)
 
-            if option.image_selector:
-                img_el = item.select_one(option.image_selector)
+            if image_sel:
+                img_el = image_sel.select_one(item)
                 if img_el:
                     list_data["image"] = Maybe.of(
                         img_el.get("src") or img_el.get("data-src") or ""
                     ).instanceof(str)
                     if list_data["image"]:
-                        list_data["image"] = urljoin(option.url, list_data["image"])
+                        list_data["image"] = join_url(option.url, list_data["image"])
 
             detail_tasks_data.append(
                 {
@@ -505,6 +739,66 @@ class CrawlerService:
 
         return detail_tasks_data
 
+    @staticmethod
+    def fast_extract_detail_urls(
+        option: CrawlRequest,
+        html: str,
+        existing_guids: Set[str],
+        max_items: int = 30,
+    ) -> Optional[list]:
+        """
+        extract_detail_urls의 selectolax(lexbor) 버전
+
+        selectolax를 사용할 수 없거나 셀렉터를 처리하지 못하면 None 반환
+        """
+        if not option.item_selector:
+            return None
+
+        try:
+            tree = parse_lexbor(
+                html, option.exclude_selectors, CrawlerService._list_selectors(option)
+            )
+            if tree is None:
+                return None
+
+            # 옵션 필드는 루프 밖에서 한 번만 읽음
+            url = option.url
+            link_selector = option.link_selector or "a"
+            title_selector = option.title_selector
+            date_selector = option.date_selector
+            image_selector = option.image_selector
+
+            detail_tasks_data = []
+            for item in tree.css(option.item_selector)[:max_items]:
+                link_el = lexbor_select_one(item, link_selector)
+                link = link_el.attributes.get("href") if link_el else None
+                if not link:
+                    continue
+
+                link = join_url(url, link)
+                if link[:499] in existing_guids:
+                    continue
+
+                list_data = {"title": "", "date": "", "image": ""}
+                list_data["title"] = lexbor_text(
+                    lexbor_select_one(item, title_selector)
+                )[:199]
+                list_data["date"] = lexbor_text(lexbor_select_one(item, date_selector))
+                img_el = lexbor_select_one(item, image_selector)
+                if img_el:
+                    image = img_el.attributes.get("src") or img_el.attributes.get(
+                        "data-src"
+                    )
+                    if image:
+                        list_data["image"] = join_url(url, image)
+
+                detail_tasks_data.append({"detail_url": link, "list_data": list_data})
+        except Exception:
+            logger.debug(f"selectolax could not handle selectors for {option.url}")
+            return None
+
+        return detail_tasks_data
+
     @staticmethod
     def crawl_detail_page(
         option: CrawlRequest, detail_url: str, list_data: dict = dict()
@@ -515,21 +809,17 @@ class CrawlerService:
         Returns:
             RSSItem 객체 또는 None
         """
-        from feeds.models import RSSItem
-
         # HTML 가져오기
         result = CrawlerService.fetch_html_for_source(option, url=detail_url)
 
         if not result.success or not result.html:
             raise Exception(result.error or "Failed to fetch HTML")
 
-        soup = BeautifulSoup(result.html, "html.parser")
+        soup = BeautifulSoup(result.html, HTML_PARSER)
 
         # exclude_selectors 적용
         if option.exclude_selectors:
-            for exclude_selector in option.exclude_selectors:
-                for el in soup.select(exclude_selector):
-                    el.decompose()
+            remove_elements(soup, option.exclude_selectors)
 
         # 상세 페이지 파싱
         parsed = CrawlerService.parse_detail_page(option, soup, detail_url, list_data)
@@ -557,19 +847,50 @@ class CrawlerService:
         detail_item_urls = CrawlerService.extract_detail_urls(
             option, soup, existing_guids, max_items=max_items
         )
+        return CrawlerService.crawl_detail_pages(option, detail_item_urls, callback)
+
+    @staticmethod
+    def crawl_detail_pages(
+        option: CrawlRequest,
+        detail_item_urls: list,
+        callback: Callable[[RSSItem], None] = lambda x: None,
+        failed_urls: Optional[list[str]] = None,
+    ) -> Tuple[int, list[RSSItem]]:
+        """
+        extract_detail_urls 결과의 상세 페이지들을 크롤링
+
+        상세 페이지는 스레드 풀에서 동시에 가져오되 호스트별 동시 요청 수는
+        DETAIL_MAX_PER_HOST로 제한하며, 결과와 callback 호출은 입력 순서를 따른다.
+        failed_urls를 넘기면 가져오지 못한 상세 페이지 URL을 모은다.
+        """
         print("Detail URLs to crawl:", len(detail_item_urls))
-        new_items: list[RSSItem] = []
-        for detail_task in detail_item_urls:
+
+        def crawl(detail_task: dict) -> Optional[RSSItem]:
             detail_url = detail_task["detail_url"]
-            list_data = detail_task["list_data"]
-            try:
-                item = CrawlerService.crawl_detail_page(option, detail_url, list_data)
-                if item:
-                    callback(item)
-                    new_items.append(item)
-            except Exception as e:
-                logger.error(f"Failed to crawl detail page {detail_url}: {e}")
-            callback(item)
+            with _detail_host_limiter.slot(detail_url):
+                return CrawlerService.crawl_detail_page(
+                    option, detail_url, detail_task["list_data"]
+                )
+
+        new_items: list[RSSItem] = []
+        if not detail_item_urls:
+            return 0, new_items
+
+        workers = min(DETAIL_MAX_WORKERS, len(detail_item_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(crawl, task) for task in detail_item_urls]
+            for detail_task, future in zip(detail_item_urls, futures):
+                try:
+                    item = future.result()
+                    if item:
+                        callback(item)
+                        new_items.append(item)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to crawl detail page {detail_task['detail_url']}: {e}"
+                    )
+                    if failed_urls is not None:
+                        failed_urls.append(detail_task["detail_url"])
         return len(detail_item_urls), new_items
 
     # ==========================================
@@ -588,8 +909,6 @@ class CrawlerService:
         Returns:
             URL 문자열 리스트
         """
-        import itertools
-
         if not variables:
             return [url_template]
 
@@ -603,18 +922,18 @@ class CrawlerService:
             values = list(range(start, end + 1, step))
             variable_ranges.append((name, values))
 
-        # 모든 조합 생성
-        if len(variable_ranges) == 1:
-            name, values = variable_ranges[0]
-            return [url_template.replace(f"{{{name}}}", str(v)) for v in values]
-        else:
-            names = [vr[0] for vr in variable_ranges]
-            value_lists = [vr[1] for vr in variable_ranges]
-            combinations = list(itertools.product(*value_lists))
-            urls = []
-            for combo in combinations:
-                url = url_template
-                for name, value in zip(names, combo):
-                    url = url.replace(f"{{{name}}}", str(value))
-                urls.append(url)
-            return urls
+        names = [vr[0] for vr in variable_ranges]
+        value_lists = [[str(v) for v in vr[1]] for vr in variable_ranges]
+
+        # 템플릿을 한 번만 분리해 두고 조합마다 플레이스홀더 자리만 채움
+        # (split 결과의 홀수 인덱스가 "{name}" 플레이스홀더)
+        placeholder = "|".join(re.escape(f"{{{name}}}") for name in names)
+        parts = re.split(f"({placeholder})", url_template)
+        slots = [(i, names.index(parts[i][1:-1])) for i in range(1, len(parts), 2)]
+
+        urls = []
+        for combo in itertools.product(*value_lists):
+            for i, var_index in slots:
+                parts[i] = combo[var_index]
+            urls.append("".join(parts))
+        return urls
@@ -2,23 +2,124 @@
 Item Service - 아이템(게시물) 관련 비즈니스 로직
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 import logging
 
 from django.shortcuts import get_object_or_404, aget_object_or_404
-from django.db.models import QuerySet, Q
+from django.db.models import QuerySet, Q, Count, Max
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
 
+from base.utils import BloomFilter, TTLCache
 from feeds.models import RSSItem
 from feeds.schemas.source import CrawlRequest
 from feeds.services.crawler import CrawlerService
 
 logger = logging.getLogger(__name__)
 
+# 이보다 아이템이 많은 피드는 GUID 전체를 set으로 올리지 않고 블룸 필터 사용
+GUID_SET_MAX_ITEMS = 20000
+
+# 워커 프로세스에 피드별 GUID 조회 객체를 남겨두고 다음 실행에는 새로 추가된 행만 읽음
+GUID_CACHE_MAXSIZE = 32
+GUID_CACHE_TTL = 60 * 60
+
+
+class FeedGuidLookup:
+    """
+    큰 피드용 기존 GUID 조회
+
+    블룸 필터에 없으면 바로 False, 있으면 (오탐일 수 있으므로) DB로 확인한다.
+    """
+
+    def __init__(self, feed_id: int, guids: Iterable[str], count: int):
+        self.feed_id = feed_id
+        self.capacity = count
+        self._bloom = BloomFilter(count)
+        for guid in guids:
+            self._bloom.add(guid)
+        self._confirmed: dict[str, bool] = {}
+
+    def add(self, guid: str) -> None:
+        self._bloom.add(guid)
+        self._confirmed.pop(guid, None)
+
+    def __contains__(self, guid: str) -> bool:
+        if guid not in self._bloom:
+            return False
+        if guid not in self._confirmed:
+            self._confirmed[guid] = RSSItem.objects.filter(
+                feed_id=self.feed_id, guid=guid
+            ).exists()
+        return self._confirmed[guid]
+
+
+# feed_id -> (GUID 조회 객체, 아이템 수, 마지막으로 읽은 아이템 id)
+_guid_cache: TTLCache[int, tuple["set[str] | FeedGuidLookup", int, int]] = TTLCache(
+    GUID_CACHE_MAXSIZE, GUID_CACHE_TTL
+)
+
+
+def _refresh_cached_guids(items: QuerySet, feed_id: int, count: int, last_id: int):
+    """
+    캐시된 GUID 조회 객체에 새 아이템만 추가해서 반환
+
+    삭제된 아이템이 있거나(set에 남은 GUID가 재수집을 막음) 크기 기준을
+    넘으면 None을 반환해 전체를 다시 읽게 한다.
+    """
+    cached = _guid_cache.get(feed_id)
+    if cached is None:
+        return None
+    guids, cached_count, cached_last_id = cached
+    if last_id < cached_last_id:
+        return None
+    new_guids = list(
+        items.filter(id__gt=cached_last_id, id__lte=last_id).values_list(
+            "guid", flat=True
+        )
+        if last_id > cached_last_id
+        else []
+    )
+    if cached_count + len(new_guids) != count:
+        return None
+    if isinstance(guids, set):
+        if count > GUID_SET_MAX_ITEMS:
+            return None
+    elif count > guids.capacity * 2:
+        return None
+    for guid in new_guids:
+        guids.add(guid)
+    return guids
+
 
 class ItemService:
     """아이템 관련 비즈니스 로직을 처리하는 서비스"""
 
+    @staticmethod
+    def existing_guids(feed_id: int) -> "set[str] | FeedGuidLookup":
+        """
+        피드의 기존 GUID 조회 객체 (in 연산만 지원, 큰 피드는 블룸 필터)
+
+        반환된 객체는 프로세스 내에 캐시되어 다음 실행에서 공유되므로
+        호출하는 쪽에서 수정하면 안 된다.
+        """
+        items = RSSItem.objects.filter(feed_id=feed_id)
+        stats = items.aggregate(count=Count("id"), last_id=Max("id"))
+        count, last_id = stats["count"], stats["last_id"] or 0
+
+        lookup = _refresh_cached_guids(items, feed_id, count, last_id)
+        if lookup is None:
+            guids = (
+                items.filter(id__lte=last_id)
+                .values_list("guid", flat=True)
+                .iterator(chunk_size=5000)
+            )
+            if count <= GUID_SET_MAX_ITEMS:
+                lookup = set(guids)
+            else:
+                lookup = FeedGuidLookup(feed_id, guids, count)
+        _guid_cache.set(feed_id, (lookup, count, last_id))
+        return lookup
+
     @staticmethod
     async def toggle_favorite(user, item_id: int) -> dict:
         """아이템 즐겨찾기 토글"""
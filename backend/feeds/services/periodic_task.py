@@ -5,7 +5,7 @@ Periodic Task Service - 주기적 태스크 관련 비즈니스 로직
 import json
 from typing import Optional
 
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 from django_celery_beat.models import PeriodicTask, IntervalSchedule
 
 from feeds.models import RSSFeed
@@ -20,16 +20,21 @@ class PeriodicTaskService:
         return list(RSSFeed.objects.filter(user=user).values_list("id", flat=True))
 
     @staticmethod
-    def get_feed_id_from_task(task: PeriodicTask) -> Optional[int]:
-        """태스크에서 피드 ID 추출"""
+    def get_feed_id_from_args(raw_args: str) -> Optional[int]:
+        """태스크 args(JSON 문자열)에서 피드 ID 추출"""
         try:
-            args = json.loads(task.args) if task.args else []
+            args = json.loads(raw_args) if raw_args else []
             if args and len(args) > 0:
                 return int(args[0])
-        except (json.JSONDecodeError, ValueError, IndexError):
+        except (json.JSONDecodeError, ValueError, IndexError, TypeError):
             pass
         return None
 
+    @staticmethod
+    def get_feed_id_from_task(task: PeriodicTask) -> Optional[int]:
+        """태스크에서 피드 ID 추출"""
+        return PeriodicTaskService.get_feed_id_from_args(task.args)
+
     @staticmethod
     def list_periodic_tasks(
         user,
@@ -130,15 +135,34 @@ class PeriodicTaskService:
 
     @staticmethod
     def get_task_stats(user) -> dict:
-        """주기적 태스크 통계"""
-        result = PeriodicTaskService.list_periodic_tasks(user, limit=1000, offset=0)
-        tasks = result["items"]
-
-        enabled_count = sum(1 for t, _, _ in tasks if t.enabled)
-        disabled_count = len(tasks) - enabled_count
+        """
+        주기적 태스크 통계
+
+        RSSFeedSchedule 매핑이 있는 태스크는 feed__user 조인 집계 한 번으로 세고,
+        매핑이 없는 예전 태스크만 args를 읽어 사용자의 피드인지 확인한다.
+        """
+        stats = PeriodicTask.objects.filter(
+            task="feeds.tasks.update_feed_items", feed_schedules__feed__user=user
+        ).aggregate(
+            total=Count("id", distinct=True),
+            enabled=Count("id", distinct=True, filter=Q(enabled=True)),
+        )
+        total, enabled_count = stats["total"], stats["enabled"]
+
+        legacy_rows = list(
+            PeriodicTask.objects.filter(
+                task="feeds.tasks.update_feed_items", feed_schedules__isnull=True
+            ).values_list("args", "enabled")
+        )
+        if legacy_rows:
+            user_feed_ids = set(PeriodicTaskService.get_user_feed_ids(user))
+            for raw_args, enabled in legacy_rows:
+                if PeriodicTaskService.get_feed_id_from_args(raw_args) in user_feed_ids:
+                    total += 1
+                    enabled_count += enabled
 
         return {
-            "total": len(tasks),
+            "total": total,
             "enabled": enabled_count,
-            "disabled": disabled_count,
+            "disabled": total - enabled_count,
         }
@@ -2,7 +2,8 @@
 Source Service - RSS Everything 소스 관련 비즈니스 로직
 """
 
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+import hashlib
 import logging
 
 from django.shortcuts import get_object_or_404
@@ -10,7 +11,9 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import re
 from ninja import Schema
+from ninja.errors import HttpError
 
+from base.utils import TTLCache
 from feeds.models import RSSFeed, RSSEverythingSource, FeedTaskResult, RSSItem
 from feeds.schemas.source import (
     PreviewItemResponse,
@@ -18,17 +21,73 @@ from feeds.schemas.source import (
     SourceUpdateSchema,
 )
 from feeds.utils.html_parser import (
+    HTML_PARSER,
+    SelectorCache,
     generate_selector,
+    lexbor_generate_selector,
+    lexbor_inserted_tbody,
+    lexbor_href,
+    lexbor_src,
+    lexbor_text,
+    parse_lexbor,
+    item_strainer,
     extract_text,
     extract_html,
     extract_href,
     extract_src,
+    select_elements,
+    truncate_html,
 )
 from feeds.services.crawler import CrawlerService
 from feeds.schemas import CrawlRequest
 
 logger = logging.getLogger(__name__)
 
+# extract_elements 응답에 포함할 최대 요소 수
+MAX_EXTRACTED_ELEMENTS = 50
+# extract_elements에서 재사용할 파싱 트리 수와 유지 시간 (트리가 크므로 편집 중인 몇 페이지만)
+TREE_CACHE_SIZE = 4
+TREE_CACHE_TTL = 120  # 초
+# 여러 소스 새로고침 시 하나의 브로커 메시지로 묶어 보낼 피드 수
+REFRESH_CHUNK_SIZE = 50
+
+# 셀렉터 선택 UI는 같은 HTML에 셀렉터만 바꿔가며 반복 호출하므로 파싱 결과를 재사용
+# (extract_elements는 트리를 수정하지 않으므로 복사 없이 공유해도 안전)
+_tree_cache: TTLCache[tuple[str, str], Any] = TTLCache(TREE_CACHE_SIZE, TREE_CACHE_TTL)
+
+# 같은 HTML·셀렉터 조합의 추출 결과 재사용 (이전 셀렉터로 되돌리거나 같은 요청을 반복할 때)
+# 키가 HTML 내용의 해시이므로 페이지를 다시 가져와 내용이 바뀌면 자연히 다른 키가 된다
+EXTRACT_CACHE_SIZE = 64
+EXTRACT_CACHE_TTL = 600  # 초
+_extract_cache: TTLCache[tuple[str, str, str], tuple[list, int]] = TTLCache(
+    EXTRACT_CACHE_SIZE, EXTRACT_CACHE_TTL
+)
+
+
+def _html_digest(html: str) -> str:
+    """캐시 키용 HTML 해시 (SHA 하드웨어 가속이 있어 blake2b보다 sha256이 빠름)"""
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+def _get_cached_tree(html: str, parser: str, digest: Optional[str] = None) -> Any:
+    """
+    (파서, HTML 해시)를 키로 파싱 결과를 캐시에서 가져오거나 새로 파싱
+
+    parser는 "lexbor" 또는 "soup". lexbor를 사용할 수 없으면 None을 반환한다.
+    이미 계산한 HTML 해시가 있으면 digest로 넘겨 다시 계산하지 않는다.
+    """
+    key = (parser, digest or _html_digest(html))
+    tree = _tree_cache.get(key)
+    if tree is not None:
+        return tree
+
+    tree = (
+        parse_lexbor(html) if parser == "lexbor" else BeautifulSoup(html, HTML_PARSER)
+    )
+    if tree is not None:
+        _tree_cache.set(key, tree)
+    return tree
+
 
 # API 응답 스키마 정의
 class ExtractedElementSchema(Schema):
@@ -86,31 +145,31 @@ class SourceService:
     def extract_elements(
         html: str, selector: str, base_url: str
     ) -> ExtractElementsResponse:
-        """HTML에서 CSS 셀렉터로 요소들을 추출"""
+        """
+        HTML에서 CSS 셀렉터로 요소들을 추출
+
+        selectolax(lexbor)로 먼저 처리하고, lexbor가 셀렉터를 지원하지 않으면
+        BeautifulSoup(soupsieve) 경로로 처리한다.
+        """
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            elements = soup.select(selector)
-
-            result_elements = []
-            for el in elements[:50]:
-                href = extract_href(el, base_url)
-                src = extract_src(el, base_url)
-
-                result_elements.append(
-                    ExtractedElementSchema(
-                        tag=el.name,
-                        text=extract_text(el)[:500],
-                        html=str(el)[:2000],
-                        href=href if href else None,
-                        src=src if src else None,
-                        selector=generate_selector(soup, el),
-                    )
+            digest = _html_digest(html)
+            cache_key = (digest, selector, base_url)
+            extracted = _extract_cache.get(cache_key)
+            if extracted is None:
+                extracted = SourceService._extract_elements_lexbor(
+                    html, selector, base_url, digest
                 )
+                if extracted is None:
+                    extracted = SourceService._extract_elements_soup(
+                        html, selector, base_url, digest
+                    )
+                _extract_cache.set(cache_key, extracted)
+            result_elements, count = extracted
 
             return ExtractElementsResponse(
                 success=True,
                 elements=result_elements,
-                count=len(elements),
+                count=count,
             )
         except Exception as e:
             logger.exception(f"Failed to extract elements with selector: {selector}")
@@ -121,6 +180,76 @@ class SourceService:
                 error=str(e),
             )
 
+    @staticmethod
+    def _extract_elements_lexbor(
+        html: str, selector: str, base_url: str, digest: Optional[str] = None
+    ) -> Optional[tuple[list[ExtractedElementSchema], int]]:
+        """
+        extract_elements의 lexbor 경로 (사용할 수 없으면 None)
+
+        lexbor가 암묵적 tbody를 넣은 페이지는 매칭과 생성되는 셀렉터가 크롤링의
+        BeautifulSoup 경로와 달라지므로 None을 반환한다.
+        """
+        tree = _get_cached_tree(html, "lexbor", digest)
+        if tree is None or lexbor_inserted_tbody(tree, html):
+            return None
+        try:
+            matches = tree.css(selector)
+        except Exception:
+            # :contains 등 lexbor가 파싱하지 못하는 셀렉터
+            return None
+
+        # 형제 요소들이 부모까지의 셀렉터를 공유하도록 캐시를 함께 사용
+        selector_cache = SelectorCache()
+        result_elements = []
+        for el in matches[:MAX_EXTRACTED_ELEMENTS]:
+            href = lexbor_href(el, base_url)
+            src = lexbor_src(el, base_url)
+
+            result_elements.append(
+                ExtractedElementSchema(
+                    tag=el.tag,
+                    text=lexbor_text(el)[:500],
+                    html=(el.html or "")[:2000],
+                    href=href if href else None,
+                    src=src if src else None,
+                    selector=lexbor_generate_selector(el, selector_cache),
+                )
+            )
+
+        return result_elements, len(matches)
+
+    @staticmethod
+    def _extract_elements_soup(
+        html: str, selector: str, base_url: str, digest: Optional[str] = None
+    ) -> tuple[list[ExtractedElementSchema], int]:
+        """extract_elements의 BeautifulSoup 경로"""
+        soup = _get_cached_tree(html, "soup", digest)
+        elements = select_elements(soup, selector, limit=MAX_EXTRACTED_ELEMENTS)
+        count = len(elements)
+        if count == MAX_EXTRACTED_ELEMENTS:
+            # 제한에 걸린 경우에만 전체 개수를 다시 계산
+            count = len(select_elements(soup, selector))
+
+        selector_cache = SelectorCache()
+        result_elements = []
+        for el in elements:
+            href = extract_href(el, base_url)
+            src = extract_src(el, base_url)
+
+            result_elements.append(
+                ExtractedElementSchema(
+                    tag=el.name,
+                    text=extract_text(el)[:500],
+                    html=truncate_html(el, 2000),
+                    href=href if href else None,
+                    src=src if src else None,
+                    selector=generate_selector(soup, el, selector_cache),
+                )
+            )
+
+        return result_elements, count
+
     @staticmethod
     def crawl(
         option: CrawlRequest,
@@ -128,45 +257,164 @@ class SourceService:
         source: Optional[RSSEverythingSource] = None,
         existing_guids: set[str] = set(),
         max_items: int = 30,
+        prefer_http: bool = False,
+        conditional: bool = False,
+        memoize: bool = False,
     ) -> tuple[int, list[RSSItem]]:
+        """
+        소스 설정으로 HTML을 가져와 아이템 크롤링
+
+        prefer_http=True면 브라우저 설정이어도 일반 HTTP로 먼저 시도하고,
+        아이템을 하나도 찾지 못한 경우에만 브라우저로 다시 가져온다.
+        memoize=True면 목록 페이지를 프로세스 내 단기 캐시에서 재사용한다 (미리보기용).
+        conditional=True면 source의 ETag/Last-Modified로 조건부 요청을 보내고,
+        304(변경 없음)이면 파싱 없이 빈 결과를 반환한다. 새 검증자는 source
+        인스턴스에만 반영하므로 아이템을 저장한 뒤 호출하는 쪽에서 함께 저장해야 한다.
+        """
+        entries, result = 0, []
+        if prefer_http and option.use_browser:
+            http_option = option.model_copy(update={"use_browser": False})
+            try:
+                entries, result = SourceService._crawl_once(
+                    http_option, existing_guids, max_items, memoize=memoize
+                )
+            except Exception as e:
+                logger.info(f"HTTP crawl failed for {option.url}, using browser: {e}")
+            if not entries:
+                entries, result = SourceService._crawl_once(
+                    option, existing_guids, max_items, memoize=memoize
+                )
+        else:
+            entries, result = SourceService._crawl_once(
+                option,
+                existing_guids,
+                max_items,
+                source if conditional else None,
+                memoize=memoize,
+            )
+
+        for entry in result:
+            if feed:
+                entry.feed = feed
+            if source:
+                entry.source = source
+        return entries, result
+
+    @staticmethod
+    def _crawl_once(
+        option: CrawlRequest,
+        existing_guids: set[str],
+        max_items: int,
+        conditional_source: Optional[RSSEverythingSource] = None,
+        memoize: bool = False,
+    ) -> tuple[int, list[RSSItem]]:
+        """
+        option 설정 그대로 HTML을 한 번 가져와 소스 타입별로 파싱
+
+        conditional_source가 있으면 조건부 요청을 보내고, 파싱까지 성공하면 응답
+        검증자를 conditional_source에 반영한다.
+        (브라우저 요청은 응답 헤더를 알 수 없으므로 일반 HTTP일 때만 적용)
+        """
+        custom_headers = option.custom_headers
+        if conditional_source is not None and not option.use_browser:
+            custom_headers = {
+                **(custom_headers or {}),
+                **conditional_source.conditional_headers,
+            }
+        else:
+            conditional_source = None
+
         result = CrawlerService.fetch_html(
             url=option.url,
             use_browser=option.use_browser,
             browser_service=option.browser_service,
             wait_selector=option.wait_selector,
-            custom_headers=option.custom_headers,
+            custom_headers=custom_headers,
+            memoize=memoize,
         )
         if not result.success:
             raise Exception(f"Failed to fetch HTML: {result.error}")
+        if result.not_modified:
+            logger.info(f"Not modified since last crawl: {option.url}")
+            return 0, []
         if not result.html:
             raise Exception("Fetched HTML is empty")
-        html = result.html
-        soup = BeautifulSoup(html, "html.parser")
+        failed_details: list[str] = []
+        parsed = SourceService._parse_html(
+            option, result.html, existing_guids, max_items, failed_details
+        )
+        # 파싱에 실패한 응답의 검증자를 남기면 다음 실행이 304로 건너뛰므로 성공한 뒤에 반영
+        if conditional_source is not None:
+            if failed_details:
+                # 상세 페이지 실패가 있으면 검증자를 비워 다음 실행에서 목록부터 다시 가져와 재시도
+                conditional_source.http_etag = ""
+                conditional_source.http_last_modified = ""
+            else:
+                SourceService._set_http_validators(conditional_source, result)
+        return parsed
+
+    @staticmethod
+    def _parse_html(
+        option: CrawlRequest,
+        html: str,
+        existing_guids: set[str],
+        max_items: int,
+        failed_details: Optional[list[str]] = None,
+    ) -> tuple[int, list[RSSItem]]:
+        """가져온 HTML을 소스 타입별로 파싱 (가져오지 못한 상세 페이지 URL은 failed_details에)"""
         if option.source_type == "rss":
-            entries, result = CrawlerService.crawl_rss_source(
+            return CrawlerService.crawl_rss_source(
                 html, None, existing_guids, max_items
             )
         elif option.source_type == "detail_page_scraping":
-            entries, result = CrawlerService.crawl_detail_scraping_source(
-                option, soup, existing_guids, max_items=max_items
+            # 목록 페이지는 lexbor로, 상세 페이지는 BeautifulSoup으로 파싱
+            detail_item_urls = CrawlerService.fast_extract_detail_urls(
+                option, html, existing_guids, max_items
+            )
+            if detail_item_urls is None:
+                strainer = item_strainer(
+                    option.item_selector, option.exclude_selectors, keep=()
+                )
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+                detail_item_urls = CrawlerService.extract_detail_urls(
+                    option, soup, existing_guids, max_items=max_items
+                )
+            return CrawlerService.crawl_detail_pages(
+                option, detail_item_urls, failed_urls=failed_details
             )
         elif option.source_type == "page_scraping":
-            entries, result = CrawlerService.crawl_page_scraping_source(
-                option, soup, existing_guids, max_items=max_items
+            # 설명 HTML이 필요 없으면 selectolax 빠른 경로 사용
+            # (매우 큰 페이지는 전체 트리 없이 아이템 단위로 스트리밍)
+            parsed = CrawlerService.stream_parse_list_page_items(
+                option, html, existing_guids, max_items
             )
+            if parsed is None:
+                parsed = CrawlerService.fast_parse_list_page_items(
+                    option, html, existing_guids, max_items
+                )
+            if parsed is None:
+                # 아이템 서브트리(+ CSS용 style/link)만 파싱
+                strainer = item_strainer(option.item_selector, option.exclude_selectors)
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+                parsed = CrawlerService.crawl_page_scraping_source(
+                    option, soup, existing_guids, max_items=max_items
+                )
+            return parsed
         else:
             raise Exception(f"Unknown source type: {option.source_type}")
-        for entry in result:
-            if feed:
-                entry.feed = feed
-            if source:
-                entry.source = source
-        return entries, result
+
+    @staticmethod
+    def _set_http_validators(source: RSSEverythingSource, result) -> None:
+        """응답의 ETag/Last-Modified를 소스 인스턴스에 반영 (저장은 호출하는 쪽에서)"""
+        source.http_etag = (result.etag or "")[:255]
+        source.http_last_modified = (result.last_modified or "")[:64]
 
     @staticmethod
     def get_user_sources(user) -> list[RSSEverythingSource]:
         """사용자의 소스 목록 조회"""
-        return list(RSSEverythingSource.objects.filter(feed__user=user))
+        return list(
+            RSSEverythingSource.objects.select_related("feed").filter(feed__user=user)
+        )
 
     @staticmethod
     def get_source(user, source_id: int) -> RSSEverythingSource:
@@ -210,60 +458,36 @@ class SourceService:
         return source
 
     @staticmethod
-    def update_source(user, source_id: int, data: dict) -> RSSEverythingSource:
+    def update_source(
+        user, source_id: int, data: SourceUpdateSchema
+    ) -> RSSEverythingSource:
         """소스 수정"""
         source = get_object_or_404(RSSEverythingSource, id=source_id, feed__user=user)
+        return SourceService._apply_source_update(source, data)
 
-        update_fields = []
-
-        if data.get("url") is not None:
-            source.url = data["url"]
-            update_fields.append("url")
-
-        if data.get("source_type") is not None:
-            source.source_type = data["source_type"]
-            update_fields.append("source_type")
-
-        if data.get("custom_headers") is not None:
-            source.custom_headers = data["custom_headers"]
-            update_fields.append("custom_headers")
-
-        if data.get("is_active") is not None:
-            source.is_active = data["is_active"]
-            update_fields.append("is_active")
-
-        if data.get("follow_links") is not None:
-            source.source_type = (
-                "detail_page_scraping" if data["follow_links"] else "page_scraping"
-            )
-            update_fields.append("source_type")
-
-        for field in [
-            "item_selector",
-            "title_selector",
-            "link_selector",
-            "description_selector",
-            "date_selector",
-            "image_selector",
-            "detail_title_selector",
-            "detail_description_selector",
-            "detail_date_selector",
-            "detail_image_selector",
-            "exclude_selectors",
-            "date_formats",
-            "date_locale",
-            "use_browser",
-            "browser_service",
-            "wait_selector",
-            "timeout",
-        ]:
-            if data.get(field) is not None:
-                setattr(source, field, data[field])
-                update_fields.append(field)
-
-        if update_fields:
-            source.save(update_fields=update_fields + ["updated_at"])
-
+    @staticmethod
+    def _apply_source_update(
+        source: RSSEverythingSource, data: SourceUpdateSchema
+    ) -> RSSEverythingSource:
+        """
+        요청에 담긴 필드 중 실제로 값이 바뀐 필드만 저장 (소스의 피드는 바꾸지 않음)
+        폼 전체를 다시 보내도 바뀐 것이 없으면 UPDATE와 검증자 초기화를 하지 않는다.
+        """
+        payload = data.dict(exclude_unset=True, exclude_none=True, exclude={"feed"})
+        update_fields = [
+            field for field, value in payload.items() if getattr(source, field) != value
+        ]
+        if not update_fields:
+            return source
+
+        for field in update_fields:
+            setattr(source, field, payload[field])
+        # 설정이 바뀌면 페이지가 그대로여도 다시 파싱해야 하므로 검증자 초기화
+        source.http_etag = source.http_last_modified = ""
+        source.save(
+            update_fields=update_fields
+            + ["http_etag", "http_last_modified", "updated_at"]
+        )
         return source
 
     @staticmethod
@@ -292,6 +516,44 @@ class SourceService:
             "message": "Refresh task started",
         }
 
+    @staticmethod
+    def refresh_sources(user, source_ids: list[int]) -> list[int]:
+        """
+        여러 소스를 한 번에 새로고침
+
+        소스가 속한 피드별로 task 결과를 한 번의 INSERT로 만들고,
+        업데이트 task는 REFRESH_CHUNK_SIZE개씩 묶어서 발행한다.
+
+        Returns:
+            생성된 task 결과 ID 목록 (사용자의 소스가 아닌 ID는 무시)
+        """
+        from feeds.tasks import update_feed_items
+
+        # 같은 피드의 소스가 여러 개여도 피드 업데이트는 한 번만
+        feed_ids = list(
+            dict.fromkeys(
+                RSSEverythingSource.objects.filter(id__in=source_ids, feed__user=user)
+                .order_by("id")
+                .values_list("feed_id", flat=True)
+            )
+        )
+        if not feed_ids:
+            return []
+
+        task_results = FeedTaskResult.objects.bulk_create(
+            [
+                FeedTaskResult(feed_id=feed_id, status=FeedTaskResult.Status.PENDING)
+                for feed_id in feed_ids
+            ]
+        )
+
+        update_feed_items.chunks(  # type:ignore
+            [(result.feed_id, result.pk) for result in task_results],
+            REFRESH_CHUNK_SIZE,
+        ).apply_async()
+
+        return [result.pk for result in task_results]
+
     @staticmethod
     def add_source_to_feed(
         user, feed_id: int, data: SourceCreateSchema
@@ -311,19 +573,11 @@ class SourceService:
         """피드의 소스 업데이트"""
         feed = get_object_or_404(RSSFeed, id=feed_id, user=user)
         source = get_object_or_404(RSSEverythingSource, id=source_id, feed=feed)
-
-        for field, value in data.dict(exclude_unset=True).items():
-            if value is not None:
-                setattr(source, field, value)
-
-        source.save()
-        return source
+        return SourceService._apply_source_update(source, data)
 
     @staticmethod
     def delete_feed_source(user, feed_id: int, source_id: int) -> bool:
         """피드의 소스 삭제"""
-        from ninja.errors import HttpError
-
         feed = get_object_or_404(RSSFeed, id=feed_id, user=user)
         source = get_object_or_404(RSSEverythingSource, id=source_id, feed=feed)
 
@@ -354,7 +608,6 @@ class SourceService:
         Returns:
             dict: {success, task_id, task_result_id, message}
         """
-        from feeds.models import FeedTaskResult
         from feeds.tasks import crawl_paginated_task
 
         # 소스 가져오기 (권한 확인)
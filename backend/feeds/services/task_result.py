@@ -5,7 +5,7 @@ Task Result Service - 태스크 결과 관련 비즈니스 로직
 from typing import Optional
 
 from django.shortcuts import get_object_or_404
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 
 from feeds.models import FeedTaskResult, RSSFeed
 
@@ -14,9 +14,9 @@ class TaskResultService:
     """태스크 결과 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_user_feed_ids(user) -> list[int]:
-        """사용자의 피드 ID 목록"""
-        return list(RSSFeed.objects.filter(user=user).values_list("id", flat=True))
+    def get_user_feed_ids(user) -> QuerySet:
+        """사용자의 피드 ID 서브쿼리 (목록을 미리 가져오지 않고 feed_id__in에 그대로 사용)"""
+        return RSSFeed.objects.filter(user=user).values("id")
 
     @staticmethod
     def list_task_results(
@@ -45,13 +45,15 @@ class TaskResultService:
         if feed_id:
             queryset = queryset.filter(feed_id=feed_id)
 
-        return {
-            "total": queryset.count(),
-            "success": queryset.filter(status=FeedTaskResult.Status.SUCCESS).count(),
-            "failure": queryset.filter(status=FeedTaskResult.Status.FAILURE).count(),
-            "pending": queryset.filter(status=FeedTaskResult.Status.PENDING).count(),
-            "running": queryset.filter(status=FeedTaskResult.Status.RUNNING).count(),
-        }
+        # 상태별 COUNT를 쿼리 한 번으로 집계
+        status = FeedTaskResult.Status
+        return queryset.aggregate(
+            total=Count("id"),
+            success=Count("id", filter=Q(status=status.SUCCESS)),
+            failure=Count("id", filter=Q(status=status.FAILURE)),
+            pending=Count("id", filter=Q(status=status.PENDING)),
+            running=Count("id", filter=Q(status=status.RUNNING)),
+        )
 
     @staticmethod
     def get_task_result(user, result_id: int) -> FeedTaskResult:
@@ -89,7 +91,7 @@ class TaskResultService:
         if status:
             queryset = queryset.filter(status=status)
 
-        deleted_count = queryset.count()
-        queryset.delete()
+        # 참조하는 모델/시그널이 없어 DELETE 한 번으로 처리되고, 삭제 개수도 함께 반환됨
+        deleted_count, _ = queryset.delete()
 
         return deleted_count
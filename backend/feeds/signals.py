@@ -1,4 +1,4 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.apps import apps
 import logging
@@ -22,21 +22,18 @@ def schedule_feed_update(sender, instance, created, **kwargs):
     setup_feed_schedule(instance)
 
 
-@receiver(post_delete, sender="feeds.RSSFeed")
+@receiver(pre_delete, sender="feeds.RSSFeed")
 def remove_feed_schedule(sender, instance, **kwargs):
     """
     RSSFeed가 삭제될 때 스케줄 제거
+    (피드와 함께 CASCADE로 지워지기 전에 스케줄 매핑을 사용하도록 pre_delete에서 처리)
     """
-    from django_celery_beat.models import PeriodicTask
+    from .management.commands.setup_feed_schedules import remove_feed_schedule_tasks
 
     logger.info(f"RSSFeed {instance.title} deleted.")
 
     # 해당 피드의 스케줄 제거
-    # 제목이 바뀌어 있을 수 있으니 args (feed.pk) 기준으로 삭제하고, 이름 기준으로도 한 번 더 시도
-    import json
-
-    PeriodicTask.objects.filter(args=json.dumps([instance.pk])).delete()
-    PeriodicTask.objects.filter(name=f"Update RSS feed: {instance.title}").delete()
+    remove_feed_schedule_tasks(instance)
 
 
 def schedule_existing_feeds():
@@ -3,55 +3,77 @@ Celery Tasks - 피드 업데이트 및 이미지 처리 태스크
 리팩토링: CrawlerService를 사용하여 중복 로직 제거
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 import os
 from typing import Optional
 from base.celery_helper import shared_task
-from celery import chord, group
+from base.utils import HostConcurrencyLimiter, HostRateLimiter
+from celery import group
+from django.db import connection, transaction
 from django.utils import timezone as django_timezone
 
 from feeds.schemas.source import CrawlRequest
+from feeds.services.item import ItemService
 from feeds.services.source import SourceService
 
 logger = getLogger(__name__)
 
+# 페이지네이션 크롤링 시 동시에 가져올 최대 페이지 수
+PAGINATION_MAX_WORKERS = 4
+# 한 피드의 소스를 동시에 크롤링할 최대 수 (같은 호스트의 소스는 차례로 처리)
+SOURCE_MAX_WORKERS = 4
+_source_host_limiter = HostConcurrencyLimiter(1)
+# 새 아이템을 모아서 저장할 단위
+ITEM_FLUSH_SIZE = 500
+# Task 결과에 남기는 에러 메시지 수
+MAX_TASK_ERRORS = 10
+
 
 # ===========================================
 # 헬퍼 함수
 # ===========================================
 
 
-def _update_source_status(source, error: str = ""):
-    """소스 상태 업데이트"""
-    source.last_crawled_at = django_timezone.now()
-    source.last_error = error
-    source.save(update_fields=["last_crawled_at", "last_error"])
+def _save_source_statuses(sources: list) -> None:
+    """소스 상태(크롤링 시각, 에러, 조건부 요청 검증자)를 한 번의 bulk_update로 저장"""
+    if not sources:
+        return
+    type(sources[0]).objects.bulk_update(
+        sources,
+        ["last_crawled_at", "last_error", "http_etag", "http_last_modified"],
+        batch_size=200,
+    )
+
+
+def _save_items(items: list) -> None:
+    """새 아이템들을 한 트랜잭션에서 ITEM_FLUSH_SIZE 단위로 저장"""
+    from feeds.models import RSSItem
+
+    if not items:
+        return
+    with transaction.atomic():
+        RSSItem.objects.bulk_create(
+            items, batch_size=ITEM_FLUSH_SIZE, ignore_conflicts=True
+        )
 
 
 def _get_or_create_task_result(task, feed, task_result_id=None):
     """Task 결과 레코드 가져오거나 생성"""
     from feeds.models import FeedTaskResult
 
-    task_result = None
-    if task_result_id:
-        try:
-            task_result = FeedTaskResult.objects.get(id=task_result_id)
-            task_result.status = FeedTaskResult.Status.RUNNING
-            task_result.task_id = task.request.id or ""
-            task_result.started_at = django_timezone.now()
-            task_result.save(update_fields=["status", "task_id", "started_at"])
-        except FeedTaskResult.DoesNotExist:
-            pass
-
-    if not task_result:
-        task_result = FeedTaskResult.objects.create(
-            feed=feed,
-            task_id=task.request.id or "",
-            status=FeedTaskResult.Status.RUNNING,
-            started_at=django_timezone.now(),
-        )
+    fields = dict(
+        task_id=task.request.id or "",
+        status=FeedTaskResult.Status.RUNNING,
+        started_at=django_timezone.now(),
+    )
+    # 조회 후 save 하지 않고 UPDATE 한 번으로 RUNNING 전환 (이후 헬퍼는 pk만 사용)
+    if task_result_id and FeedTaskResult.objects.filter(id=task_result_id).update(
+        **fields
+    ):
+        return FeedTaskResult(id=task_result_id, feed=feed, **fields)
 
-    return task_result
+    return FeedTaskResult.objects.create(feed=feed, **fields)
 
 
 def _complete_task_result(
@@ -60,24 +82,18 @@ def _complete_task_result(
     """Task 결과 완료 처리"""
     from feeds.models import FeedTaskResult
 
-    if errors:
-        task_result.status = FeedTaskResult.Status.SUCCESS
-        task_result.error_message = "; ".join(errors[:10])
-    else:
-        task_result.status = FeedTaskResult.Status.SUCCESS
-
-    task_result.items_found = items_found
-    task_result.items_created = items_created
-    task_result.completed_at = django_timezone.now()
-    task_result.save(
-        update_fields=[
-            "status",
-            "items_found",
-            "items_created",
-            "error_message",
-            "completed_at",
-        ]
+    fields = dict(
+        status=FeedTaskResult.Status.SUCCESS,
+        items_found=items_found,
+        items_created=items_created,
+        completed_at=django_timezone.now(),
     )
+    if errors:
+        fields["error_message"] = "; ".join(errors[:MAX_TASK_ERRORS])
+
+    for name, value in fields.items():
+        setattr(task_result, name, value)
+    FeedTaskResult.objects.filter(pk=task_result.pk).update(**fields)
 
 
 def _fail_task_result(task_result, error: str):
@@ -88,7 +104,11 @@ def _fail_task_result(task_result, error: str):
         task_result.status = FeedTaskResult.Status.FAILURE
         task_result.error_message = error
         task_result.completed_at = django_timezone.now()
-        task_result.save(update_fields=["status", "error_message", "completed_at"])
+        FeedTaskResult.objects.filter(pk=task_result.pk).update(
+            status=task_result.status,
+            error_message=error,
+            completed_at=task_result.completed_at,
+        )
 
 
 # ===========================================
@@ -101,12 +121,13 @@ def update_feed_items(self, feed_id, task_result_id=None):
     """
     특정 RSS 피드의 아이템들을 업데이트하는 task
     """
-    from feeds.models import RSSFeed, RSSItem, FeedTaskResult, RSSEverythingSource
+    from feeds.models import RSSFeed, FeedTaskResult, RSSEverythingSource
     from feeds.services.crawler import CrawlerService
 
     # 피드 가져오기
     try:
-        feed = RSSFeed.objects.prefetch_related("sources").get(id=feed_id)
+        # 큰 텍스트 컬럼(description, custom_css)은 task에서 쓰지 않으므로 읽지 않음
+        feed = RSSFeed.objects.only("id", "title").get(id=feed_id)
         logger.info(f"Updating feed: {feed.title}")
     except RSSFeed.DoesNotExist:
         if task_result_id:
@@ -126,24 +147,51 @@ def update_feed_items(self, feed_id, task_result_id=None):
         errors = []
 
         # 활성화된 소스 처리
-        active_sources = feed.sources.filter(is_active=True)
-        existing_guids = set(
-            RSSItem.objects.filter(feed=feed).values_list("guid", flat=True)
-        )
-
-        for source in active_sources:
+        active_sources = list(feed.sources.filter(is_active=True))
+        existing_guids = ItemService.existing_guids(feed.pk)
+
+        def crawl_source(source):
+            with _source_host_limiter.slot(source.url):
+                try:
+                    return SourceService.crawl(
+                        CrawlRequest.from_orm(source),
+                        feed=feed,
+                        source=source,
+                        existing_guids=existing_guids,
+                        conditional=True,
+                    )
+                finally:
+                    # 워커 스레드에서 열렸을 수 있는 DB 연결 정리
+                    connection.close()
+
+        new_items = []
+        futures = []
+        if active_sources:
+            # 소스들은 동시에 크롤링하고 결과는 소스 순서대로 모음
+            workers = min(SOURCE_MAX_WORKERS, len(active_sources))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for source in active_sources:
+                    source.last_crawled_at = django_timezone.now()
+                    futures.append(executor.submit(crawl_source, source))
+
+        for source, future in zip(active_sources, futures):
             try:
-                option = CrawlRequest.from_orm(source)
-                entries, items = SourceService.crawl(
-                    option, feed=feed, source=source, existing_guids=existing_guids
-                )
-                RSSItem.objects.bulk_create(items, ignore_conflicts=True)
+                entries, items = future.result()
+                new_items.extend(items)
                 total_found += entries
                 total_created += len(items)
+                source.last_error = ""
             except Exception as e:
                 logger.exception(f"Failed to update from source {source.id}")
                 errors.append(f"Source {source.id}: {str(e)}")
-                _update_source_status(source, str(e))
+                source.last_error = str(e)
+
+        # 모든 소스의 새 아이템을 한 번에 저장
+        _save_items(new_items)
+
+        # 소스별 크롤링 시각, 에러(성공하면 비움), 검증자는 아이템을 저장한 뒤 한 번에 기록
+        # (저장에 실패하면 검증자가 남지 않아 다음 실행에서 다시 가져옴)
+        _save_source_statuses(active_sources)
 
         _complete_task_result(
             task_result, total_found, total_created, errors if errors else None
@@ -174,13 +222,16 @@ def crawl_paginated_task(
     """
     페이지네이션 크롤링 - 소스 타입에 따라 적절한 방식으로 처리
     """
-    import time
-    from feeds.models import RSSItem, RSSEverythingSource, FeedTaskResult
+    from feeds.models import RSSFeed, RSSItem, RSSEverythingSource, FeedTaskResult
     from feeds.services.crawler import CrawlerService
 
     # 소스 가져오기
     try:
-        source = RSSEverythingSource.objects.select_related("feed").get(id=source_id)
+        source = (
+            RSSEverythingSource.objects.select_related("feed")
+            .defer("feed__description", "feed__custom_css")
+            .get(id=source_id)
+        )
         feed = source.feed
     except RSSEverythingSource.DoesNotExist:
         error_msg = f"RSSEverythingSource {source_id} does not exist"
@@ -212,39 +263,67 @@ def crawl_paginated_task(
         total_items_found = 0
         total_items_created = 0
         errors = []
+        error_count = 0
 
         # 기존 GUID
-        existing_guids = set(
-            RSSItem.objects.filter(feed=feed).values_list("guid", flat=True)
-        )
+        existing_guids = ItemService.existing_guids(feed.pk)
 
         logger.info(
             f"Starting pagination crawl for source {source_id}: {total_pages} pages, type={source.source_type}"
         )
 
-        for i, url in enumerate(urls):
+        # 소스 설정은 한 번만 변환하고 페이지마다 URL만 바꿔서 사용
+        base_option = CrawlRequest.from_orm(source)
+        # 페이지는 병렬로 가져오되 같은 호스트에는 delay_ms 간격으로 요청
+        rate_limiter = HostRateLimiter(delay_ms / 1000.0)
+
+        def crawl_page(i: int, url: str):
+            rate_limiter.wait(url)
+            logger.info(f"Crawling page {i + 1}/{total_pages}: {url}")
+            option = base_option.model_copy(update={"url": url})
             try:
-                logger.info(f"Crawling page {i + 1}/{total_pages}: {url}")
-                option = CrawlRequest.from_orm(source)
-                option.url = url
-                entries, items = SourceService.crawl(
+                return SourceService.crawl(
                     option, feed=feed, source=source, existing_guids=existing_guids
                 )
-                RSSItem.objects.bulk_create(items, ignore_conflicts=True)
+            finally:
+                # 큰 피드의 GUID 확인 쿼리가 워커 스레드에서 연 DB 연결 정리
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=PAGINATION_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(crawl_page, i, url) for i, url in enumerate(urls)
+            ]
+
+        seen_guids: set[str] = set()
+        pending: list[RSSItem] = []
+        for i, (url, future) in enumerate(zip(urls, futures)):
+            try:
+                entries, items = future.result()
                 total_items_found += entries
-                total_items_created += len(items)
-                # 딜레이
-                if i < len(urls) - 1 and delay_ms > 0:
-                    time.sleep(delay_ms / 1000.0)
-
+                for item in items:
+                    # 여러 페이지에 걸쳐 중복된 아이템은 한 번만 저장
+                    if item.guid not in seen_guids:
+                        seen_guids.add(item.guid)
+                        pending.append(item)
             except Exception as e:
                 logger.exception(f"Error crawling page {i + 1}: {url}")
-                errors.append(f"Page {i + 1} ({url}): {str(e)}")
+                error_count += 1
+                # 결과에는 앞쪽 MAX_TASK_ERRORS개만 남기므로 그 뒤로는 메시지를 만들지 않음
+                if len(errors) < MAX_TASK_ERRORS:
+                    errors.append(f"Page {i + 1} ({url}): {str(e)}")
+
+            if len(pending) >= ITEM_FLUSH_SIZE:
+                _save_items(pending)
+                pending = []
+
+        _save_items(pending)
+        total_items_created = len(seen_guids)
 
-        # 피드 업데이트
+        # 피드 업데이트 (전체 save 대신 last_updated만 UPDATE, post_save 스케줄 갱신도 생략)
         if total_items_created > 0:
-            feed.last_updated = django_timezone.now()
-            feed.save()
+            RSSFeed.objects.filter(pk=feed.pk).update(
+                last_updated=django_timezone.now()
+            )
 
         _complete_task_result(
             task_result,
@@ -254,15 +333,16 @@ def crawl_paginated_task(
         )
 
         message = f"Crawled {total_pages} pages, found {total_items_found}, created {total_items_created}"
-        if errors:
-            message += f", {len(errors)} errors"
+        if error_count:
+            message += f", {error_count} errors"
 
         return {
-            "success": len(errors) == 0 or total_items_created > 0,
+            "success": error_count == 0 or total_items_created > 0,
             "total_pages": total_pages,
             "total_items_found": total_items_found,
             "total_items_created": total_items_created,
             "errors": errors,
+            "error_count": error_count,
             "message": message,
         }
 
@@ -282,11 +362,15 @@ def update_feeds_by_category(category_id):
     """특정 카테고리의 모든 피드 업데이트"""
     from feeds.models import RSSFeed
 
-    feeds = RSSFeed.objects.filter(category_id=category_id, visible=True)
-    for feed in feeds:
-        update_feed_items.delay(feed.pk)
+    feed_ids = list(
+        RSSFeed.objects.filter(category_id=category_id, visible=True).values_list(
+            "pk", flat=True
+        )
+    )
+    # 피드마다 delay를 부르지 않고 group으로 한 번에 발행
+    group(update_feed_items.s(feed_id) for feed_id in feed_ids).apply_async()
 
-    return f"Scheduled updates for {len(feeds)} feeds in category {category_id}"
+    return f"Scheduled updates for {len(feed_ids)} feeds in category {category_id}"
 
 
 @shared_task
@@ -294,11 +378,11 @@ def update_all_feeds():
     """모든 활성화된 피드 업데이트"""
     from feeds.models import RSSFeed
 
-    feeds = RSSFeed.objects.filter(visible=True)
-    for feed in feeds:
-        update_feed_items.delay(feed.pk)
+    feed_ids = list(RSSFeed.objects.filter(visible=True).values_list("pk", flat=True))
+    # 피드마다 delay를 부르지 않고 group으로 한 번에 발행
+    group(update_feed_items.s(feed_id) for feed_id in feed_ids).apply_async()
 
-    return f"Scheduled updates for {len(feeds)} feeds"
+    return f"Scheduled updates for {len(feed_ids)} feeds"
 
 
 @shared_task
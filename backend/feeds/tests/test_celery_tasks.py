@@ -4,8 +4,9 @@
 from unittest.mock import patch
 
 from django.test import TestCase
+from django.utils import timezone
 
-from feeds.models import FeedTaskResult, RSSEverythingSource, RSSFeed
+from feeds.models import FeedTaskResult, RSSEverythingSource, RSSFeed, RSSItem
 from feeds.tests.conftest import BaseTestCase
 
 
@@ -51,6 +52,152 @@ class CeleryTaskTest(TestCase, BaseTestCase):
         final_count = FeedTaskResult.objects.filter(feed=self.feed).count()
         self.assertGreaterEqual(final_count, initial_count)
 
+    def test_update_feed_items_updates_existing_task_result(self) -> None:
+        """전달된 task_result를 UPDATE로 완료 처리하고 실패한 소스 상태를 기록"""
+        from feeds.tasks import update_feed_items
+
+        source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            source_type=RSSEverythingSource.SourceType.RSS,
+            url="http://invalid-url-for-test.com/rss",
+        )
+        task_result = FeedTaskResult.objects.create(
+            feed=self.feed, status=FeedTaskResult.Status.PENDING
+        )
+
+        with patch("feeds.tasks.SourceService.crawl") as mock_crawl:
+            mock_crawl.side_effect = Exception("Mock fetch failure")
+            update_feed_items(self.feed.pk, task_result.pk)
+
+        task_result.refresh_from_db()
+        self.assertEqual(task_result.status, FeedTaskResult.Status.SUCCESS)
+        self.assertIsNotNone(task_result.started_at)
+        self.assertIsNotNone(task_result.completed_at)
+        self.assertIn("Mock fetch failure", task_result.error_message)
+        self.assertEqual(FeedTaskResult.objects.filter(feed=self.feed).count(), 1)
+
+        source.refresh_from_db()
+        self.assertEqual(source.last_error, "Mock fetch failure")
+        self.assertIsNotNone(source.last_crawled_at)
+
+    def test_update_feed_items_skips_large_feed_columns(self) -> None:
+        """피드의 큰 텍스트 컬럼(custom_css 등)은 읽지 않음"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from feeds.tasks import update_feed_items
+
+        RSSEverythingSource.objects.create(
+            feed=self.feed,
+            source_type=RSSEverythingSource.SourceType.RSS,
+            url="http://invalid-url-for-test.com/rss",
+        )
+
+        with patch(
+            "feeds.tasks.SourceService.crawl", return_value=(0, [])
+        ) as mock_crawl, CaptureQueriesContext(connection) as context:
+            update_feed_items(self.feed.pk)
+
+        mock_crawl.assert_called_once()
+        feed_selects = [
+            q["sql"]
+            for q in context.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "feeds_rssfeed"' in q["sql"]
+        ]
+        self.assertEqual(len(feed_selects), 1)
+        self.assertNotIn("custom_css", feed_selects[0])
+
+    def test_sources_on_different_hosts_are_crawled_concurrently(self) -> None:
+        """다른 호스트의 소스는 동시에 크롤링"""
+        import threading
+
+        from feeds.tasks import update_feed_items
+
+        for host in ["a.example.com", "b.example.com"]:
+            RSSEverythingSource.objects.create(
+                feed=self.feed,
+                source_type=RSSEverythingSource.SourceType.RSS,
+                url=f"http://{host}/rss",
+            )
+        # 두 소스가 동시에 진행 중이어야 통과하는 배리어
+        barrier = threading.Barrier(2, timeout=2)
+
+        def crawl(option, **kwargs):
+            barrier.wait()
+            return 1, []
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=crawl):
+            update_feed_items(self.feed.pk)
+
+        task_result = FeedTaskResult.objects.get(feed=self.feed)
+        self.assertEqual(task_result.items_found, 2)
+        self.assertFalse(task_result.error_message)
+
+    def test_source_statuses_are_saved_in_one_update(self) -> None:
+        """소스 상태는 성공/실패와 관계없이 UPDATE 한 번으로 기록하고 성공하면 에러를 비움"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from feeds.tasks import update_feed_items
+
+        sources = [
+            RSSEverythingSource.objects.create(
+                feed=self.feed,
+                source_type=RSSEverythingSource.SourceType.RSS,
+                url=f"http://invalid-url-for-test.com/rss/{i}",
+                last_error="old error",
+            )
+            for i in range(3)
+        ]
+
+        def crawl(option, **kwargs):
+            if option.url.endswith("/0"):
+                return 0, []
+            raise Exception(f"failed {option.url}")
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=crawl), CaptureQueriesContext(
+            connection
+        ) as context:
+            update_feed_items(self.feed.pk)
+
+        source_updates = [
+            q["sql"]
+            for q in context.captured_queries
+            if q["sql"].startswith('UPDATE "feeds_rsseverythingsource"')
+        ]
+        self.assertEqual(len(source_updates), 1)
+        for source in sources:
+            source.refresh_from_db()
+            expected = "" if source.url.endswith("/0") else f"failed {source.url}"
+            self.assertEqual(source.last_error, expected)
+            self.assertIsNotNone(source.last_crawled_at)
+
+    def test_validators_are_saved_after_items(self) -> None:
+        """검증자는 아이템 저장이 성공한 뒤에만 소스 상태와 함께 기록"""
+        from feeds.tasks import update_feed_items
+
+        source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            source_type=RSSEverythingSource.SourceType.RSS,
+            url="http://invalid-url-for-test.com/rss",
+        )
+
+        def crawl(option, source=None, **kwargs):
+            source.http_etag = '"v1"'
+            return 0, []
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=crawl), patch(
+            "feeds.tasks._save_items", side_effect=Exception("db down")
+        ):
+            update_feed_items(self.feed.pk)
+        source.refresh_from_db()
+        self.assertEqual(source.http_etag, "")
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=crawl):
+            update_feed_items(self.feed.pk)
+        source.refresh_from_db()
+        self.assertEqual(source.http_etag, '"v1"')
+
     def test_update_feeds_by_category(self) -> None:
         """카테고리별 피드 업데이트 스케줄링 테스트"""
         from feeds.tasks import update_feeds_by_category
@@ -63,22 +210,121 @@ class CeleryTaskTest(TestCase, BaseTestCase):
             visible=True,
         )
 
-        # update_feed_items.delay를 mock
-        with patch("feeds.tasks.update_feed_items.delay") as mock_delay:
+        # group 발행을 mock
+        with patch("feeds.tasks.group") as mock_group:
             result = update_feeds_by_category(self.category.pk)
 
-            # visible=True인 피드들에 대해 delay가 호출되었는지 확인
-            self.assertEqual(mock_delay.call_count, 2)
+            # visible=True인 피드들이 한 번의 group으로 발행되었는지 확인
+            mock_group.assert_called_once()
+            mock_group.return_value.apply_async.assert_called_once()
+            signatures = list(mock_group.call_args.args[0])
+            self.assertEqual(len(signatures), 2)
             self.assertIn("2 feeds", result)
 
     def test_update_all_feeds(self) -> None:
         """전체 피드 업데이트 스케줄링 테스트"""
         from feeds.tasks import update_all_feeds
 
-        # update_feed_items.delay를 mock
-        with patch("feeds.tasks.update_feed_items.delay") as mock_delay:
+        # group 발행을 mock
+        with patch("feeds.tasks.group") as mock_group:
             result = update_all_feeds()
 
-            # visible=True인 피드에 대해 delay가 호출되었는지 확인
-            self.assertGreaterEqual(mock_delay.call_count, 1)
+            # visible=True인 피드들이 한 번의 group으로 발행되었는지 확인
+            mock_group.return_value.apply_async.assert_called_once()
+            signatures = list(mock_group.call_args.args[0])
+            self.assertGreaterEqual(len(signatures), 1)
+            self.assertEqual(signatures[0].args, (self.feed.pk,))
             self.assertIn("feeds", result)
+
+
+class CrawlPaginatedTaskTest(TestCase, BaseTestCase):
+    """crawl_paginated_task 테스트 (크롤링은 mock)"""
+
+    def setUp(self) -> None:
+        self.user = self.create_user("paginateduser")
+        self.category = self.create_category(self.user, "Paginated Category")
+        self.feed = self.create_feed(self.user, self.category, "Paginated Feed")
+        self.source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            source_type=RSSEverythingSource.SourceType.PAGE_SCRAPING,
+            url="https://example.com/list",
+            item_selector="article",
+        )
+
+    def _item(self, guid: str) -> RSSItem:
+        return RSSItem(
+            feed=self.feed,
+            source=self.source,
+            title=guid,
+            link=f"https://example.com/{guid}",
+            guid=guid,
+            published_at=timezone.now(),
+        )
+
+    def test_pages_are_saved_once_and_errors_collected(self) -> None:
+        """모든 페이지 결과를 모아 중복 없이 저장하고 실패한 페이지는 에러로 기록"""
+        from feeds.tasks import crawl_paginated_task
+
+        def fake_crawl(option, **kwargs):
+            page = option.url.rsplit("=", 1)[1]
+            if page == "3":
+                raise Exception("boom")
+            return 2, [self._item(f"p{page}"), self._item("shared")]
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=fake_crawl):
+            result = crawl_paginated_task(
+                self.source.pk,
+                "https://example.com/list?page={page}",
+                [{"name": "page", "start": 1, "end": 3, "step": 1}],
+                delay_ms=0,
+            )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            set(RSSItem.objects.filter(feed=self.feed).values_list("guid", flat=True)),
+            {"p1", "p2", "shared"},
+        )
+        task_result = FeedTaskResult.objects.get(feed=self.feed)
+        self.assertEqual(task_result.items_found, 4)
+        self.assertEqual(task_result.items_created, 3)
+        self.assertIn("Page 3", task_result.error_message)
+
+    def test_feed_last_updated_is_written_without_full_save(self) -> None:
+        """새 아이템이 있으면 last_updated만 UPDATE하고 post_save 스케줄 갱신은 하지 않음"""
+        from feeds.tasks import crawl_paginated_task
+
+        before = RSSFeed.objects.get(pk=self.feed.pk).last_updated
+
+        with patch(
+            "feeds.tasks.SourceService.crawl",
+            return_value=(1, [self._item("fresh")]),
+        ), patch(
+            "feeds.management.commands.setup_feed_schedules.setup_feed_schedule"
+        ) as mock_schedule:
+            crawl_paginated_task(
+                self.source.pk,
+                "https://example.com/list?page={page}",
+                [{"name": "page", "start": 1, "end": 1, "step": 1}],
+                delay_ms=0,
+            )
+
+        self.assertGreater(RSSFeed.objects.get(pk=self.feed.pk).last_updated, before)
+        mock_schedule.assert_not_called()
+
+    def test_error_messages_are_bounded(self) -> None:
+        """실패한 페이지 수는 모두 세되 메시지는 MAX_TASK_ERRORS개까지만 보관"""
+        from feeds.tasks import MAX_TASK_ERRORS, crawl_paginated_task
+
+        with patch("feeds.tasks.SourceService.crawl", side_effect=Exception("boom")):
+            result = crawl_paginated_task(
+                self.source.pk,
+                "https://example.com/list?page={page}",
+                [{"name": "page", "start": 1, "end": MAX_TASK_ERRORS + 2, "step": 1}],
+                delay_ms=0,
+            )
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error_count"], MAX_TASK_ERRORS + 2)
+        self.assertEqual(len(result["errors"]), MAX_TASK_ERRORS)
+        self.assertTrue(result["errors"][0].startswith("Page 1 "))
+        self.assertIn(f"{MAX_TASK_ERRORS + 2} errors", result["message"])
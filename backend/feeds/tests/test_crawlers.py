@@ -1,6 +1,8 @@
 # feeds/tests/test_crawlers.py
 """크롤러 추상화 테스트 (네트워크 호출 없이)"""
 
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from feeds.browser_crawler import BrowserCrawler, BrowserlessCrawler, RealBrowserCrawler, get_crawler
@@ -61,3 +63,480 @@ class CrawlerAbstractionTest(TestCase):
         self.assertEqual(WaitUntil.DOMCONTENTLOADED.value, "domcontentloaded")
         self.assertEqual(WaitUntil.NETWORKIDLE0.value, "networkidle0")
         self.assertEqual(WaitUntil.NETWORKIDLE2.value, "networkidle2")
+
+    def test_realbrowser_fetch_uses_pooled_session(self) -> None:
+        """RealBrowser 요청은 공유 커넥션 풀을 통해 나감"""
+        from unittest.mock import MagicMock
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"success": True, "data": ["<html></html>"]}
+        with patch("feeds.crawlers.realbrowser._http.get", return_value=response) as mock_get:
+            result = RealBrowserCrawler().fetch_html_raw("https://example.com")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.html, "<html></html>")
+        mock_get.assert_called_once()
+
+
+class FetchHtmlCacheTest(TestCase):
+    """CrawlerService.fetch_html 프로세스 내 캐시 테스트"""
+
+    def setUp(self) -> None:
+        from feeds.services.crawler import _fetch_cache
+
+        _fetch_cache.clear()
+
+    def test_repeated_fetch_uses_cache(self) -> None:
+        """같은 옵션으로 반복 요청 시 한 번만 가져옴"""
+        from feeds.services.crawler import CrawlerService
+
+        result = CrawlResult(success=True, html="<html></html>", url="https://example.com")
+        with patch(
+            "feeds.services.crawler.fetch_html_with_browser", return_value=result
+        ) as mock_fetch:
+            first = CrawlerService.fetch_html("https://example.com", memoize=True)
+            second = CrawlerService.fetch_html("https://example.com", memoize=True)
+
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertIs(first, second)
+
+    def test_cache_is_opt_in(self) -> None:
+        """memoize 없이(예약 크롤링) 호출하면 미리보기가 캐시한 결과를 쓰지 않음"""
+        from feeds.services.crawler import CrawlerService
+
+        result = CrawlResult(success=True, html="<html></html>", url="https://example.com")
+        with patch(
+            "feeds.services.crawler.fetch_html_with_browser", return_value=result
+        ) as mock_fetch:
+            CrawlerService.fetch_html("https://example.com", memoize=True)
+            CrawlerService.fetch_html("https://example.com")
+            CrawlerService.fetch_html("https://example.com")
+
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    def test_use_cache_false_bypasses_cache(self) -> None:
+        """use_cache=False면 매번 새로 가져옴"""
+        from feeds.services.crawler import CrawlerService
+
+        result = CrawlResult(success=True, html="<html></html>", url="https://example.com")
+        with patch(
+            "feeds.services.crawler.fetch_html_with_browser", return_value=result
+        ) as mock_fetch:
+            CrawlerService.fetch_html(
+                "https://example.com", use_cache=False, memoize=True
+            )
+            CrawlerService.fetch_html(
+                "https://example.com", use_cache=False, memoize=True
+            )
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    def test_failed_fetch_is_not_cached(self) -> None:
+        """실패한 결과는 캐시하지 않음"""
+        from feeds.services.crawler import CrawlerService
+
+        result = CrawlResult(success=False, error="boom", url="https://example.com")
+        with patch(
+            "feeds.services.crawler.fetch_html_with_browser", return_value=result
+        ) as mock_fetch:
+            CrawlerService.fetch_html("https://example.com", memoize=True)
+            CrawlerService.fetch_html("https://example.com", memoize=True)
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+
+class ListPageParsingTest(TestCase):
+    """CrawlerService.parse_list_page_items 테스트 (네트워크 호출 없이)"""
+
+    HTML = """
+    <html><body>
+      <div class="ad"><article class="post"><a href="/ad">Ad</a></article></div>
+      <article class="post">
+        <h2><a href="/posts/1">First</a></h2>
+        <span class="date">2025-01-02</span>
+        <img src="/img/1.png">
+      </article>
+      <article class="post">
+        <h2><a href="https://other.example.com/2">Second</a></h2>
+      </article>
+      <article class="post"><h2></h2></article>
+    </body></html>
+    """
+
+    def _parse(self, existing_guids=None, **options):
+        from bs4 import BeautifulSoup
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article.post",
+            exclude_selectors=[".ad"],
+            **options,
+        )
+        soup = BeautifulSoup(self.HTML, "html.parser")
+        return CrawlerService.parse_list_page_items(
+            option, soup, existing_guids or set()
+        )
+
+    def test_extracts_fields(self) -> None:
+        """제목/링크/날짜/이미지 추출 및 제외 셀렉터 적용"""
+        items = self._parse(
+            title_selector="h2 a",
+            date_selector=".date",
+            image_selector="img",
+            date_formats=["%Y-%m-%d"],
+        )
+
+        self.assertEqual([item.title for item in items], ["First", "Second"])
+        self.assertEqual(items[0].link, "https://example.com/posts/1")
+        self.assertEqual(items[0].image, "https://example.com/img/1.png")
+        self.assertEqual(items[0].published_at.year, 2025)
+        self.assertEqual(items[1].link, "https://other.example.com/2")
+
+    def test_link_selector_used_as_title_fallback(self) -> None:
+        """title_selector가 없으면 link_selector 텍스트를 제목으로 사용"""
+        items = self._parse(link_selector="a")
+
+        self.assertEqual([item.title for item in items], ["First", "Second"])
+        self.assertEqual(items[0].guid, "https://example.com/posts/1")
+
+    def test_skips_existing_guids(self) -> None:
+        """이미 존재하는 GUID는 건너뜀"""
+        items = self._parse(
+            title_selector="h2 a", existing_guids={"https://example.com/posts/1"}
+        )
+
+        self.assertEqual([item.title for item in items], ["Second"])
+
+    def test_page_css_extracted_once_for_descriptions(self) -> None:
+        """설명 HTML에 붙는 문서 CSS는 아이템마다가 아니라 페이지당 한 번만 추출"""
+        from feeds.utils import html_parser
+
+        with patch(
+            "feeds.services.crawler.extract_css_from_html",
+            wraps=html_parser.extract_css_from_html,
+        ) as mock_css:
+            items = self._parse(title_selector="h2 a", description_selector="h2")
+
+        self.assertEqual(len(items), 2)
+        mock_css.assert_called_once()
+        self.assertIn('href="https://example.com/posts/1"', items[0].description)
+
+    def test_page_scraping_selects_items_once(self) -> None:
+        """아이템 선택 결과를 파싱과 개수 계산에 함께 사용 (제외 셀렉터 적용 후)"""
+        from bs4 import BeautifulSoup
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+        from feeds.utils import html_parser
+
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article.post",
+            exclude_selectors=[".ad"],
+            title_selector="h2 a",
+        )
+        soup = BeautifulSoup(self.HTML, "html.parser")
+        with patch(
+            "feeds.services.crawler.select_elements",
+            wraps=html_parser.select_elements,
+        ) as mock_select:
+            items_found, items = CrawlerService.crawl_page_scraping_source(
+                option, soup, set(), max_items=1
+            )
+
+        mock_select.assert_called_once()
+        self.assertEqual(items_found, 3)
+        self.assertEqual([item.title for item in items], ["First"])
+
+    def test_fast_path_matches_soup_path(self) -> None:
+        """selectolax 빠른 경로가 BeautifulSoup 경로와 같은 결과를 반환"""
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+
+        options = dict(
+            title_selector="h2 a",
+            date_selector=".date",
+            image_selector="img",
+            date_formats=["%Y-%m-%d"],
+        )
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article.post",
+            exclude_selectors=[".ad"],
+            **options,
+        )
+
+        parsed = CrawlerService.fast_parse_list_page_items(option, self.HTML, set())
+        self.assertIsNotNone(parsed)
+        items_found, fast_items = parsed
+        soup_items = self._parse(**options)
+
+        self.assertEqual(items_found, 3)
+        self.assertEqual(
+            [(i.title, i.link, i.image, i.published_at.date()) for i in fast_items],
+            [(i.title, i.link, i.image, i.published_at.date()) for i in soup_items],
+        )
+
+    def test_fast_path_skipped_for_description(self) -> None:
+        """설명 HTML이 필요하면 빠른 경로를 사용하지 않음"""
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article.post",
+            description_selector="h2",
+        )
+
+        self.assertIsNone(
+            CrawlerService.fast_parse_list_page_items(option, self.HTML, set())
+        )
+
+    def test_fast_detail_urls_match_soup_path(self) -> None:
+        """상세 URL 추출도 selectolax 경로와 BeautifulSoup 경로 결과가 동일"""
+        from bs4 import BeautifulSoup
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article.post",
+            exclude_selectors=[".ad"],
+            title_selector="h2 a",
+            date_selector=".date",
+            image_selector="img",
+        )
+        soup = BeautifulSoup(self.HTML, "html.parser")
+
+        fast = CrawlerService.fast_extract_detail_urls(option, self.HTML, set())
+        slow = CrawlerService.extract_detail_urls(option, soup, set())
+
+        self.assertEqual(len(fast), 2)
+        self.assertEqual(fast, slow)
+
+    def test_streaming_path_matches_fast_path(self) -> None:
+        """큰 페이지 스트리밍 파싱 결과가 selectolax 경로와 동일 (테이블 행 포함)"""
+        from unittest.mock import patch
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services import crawler
+        from feeds.services.crawler import CrawlerService
+
+        rows = "".join(
+            f'<tr class="row"><td><a href="/p/{i}">Post {i} &amp; co</a></td>'
+            f'<td><img data-src="/i/{i}.png"></td></tr>'
+            for i in range(40)
+        )
+        html = f"<html><body><table>{rows}</table></body></html>"
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="tr.row",
+            title_selector="a",
+            image_selector="img",
+        )
+
+        self.assertIsNone(
+            CrawlerService.stream_parse_list_page_items(option, html, set())
+        )
+        with patch.object(crawler, "STREAMING_PARSE_THRESHOLD", 100):
+            streamed = CrawlerService.stream_parse_list_page_items(
+                option, html, {"https://example.com/p/1"}, max_items=10
+            )
+        fast = CrawlerService.fast_parse_list_page_items(
+            option, html, {"https://example.com/p/1"}, max_items=10
+        )
+
+        self.assertIsNotNone(streamed)
+        self.assertEqual(streamed[0], 40)
+        self.assertEqual(len(streamed[1]), 9)
+        self.assertEqual(streamed[1][0].title, "Post 0 & co")
+        self.assertEqual(
+            [(i.title, i.link, i.image) for i in streamed[1]],
+            [(i.title, i.link, i.image) for i in fast[1]],
+        )
+
+    def test_streaming_path_keeps_non_ascii_text(self) -> None:
+        """스트리밍 파싱은 meta charset과 chunk 경계에 관계없이 한글 제목을 유지"""
+        from functools import partial
+        from unittest.mock import patch
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services import crawler
+        from feeds.services.crawler import CrawlerService
+        from feeds.utils.html_parser import stream_item_fragments
+
+        rows = "".join(
+            f'<li class="row"><a href="/p/{i}">게시글 {i} — café</a></li>'
+            for i in range(20)
+        )
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="li.row",
+            title_selector="a",
+        )
+        for meta in ("", '<meta charset="euc-kr">'):
+            html = f"<html><head>{meta}</head><body><ul>{rows}</ul></body></html>"
+            with self.subTest(meta=meta), patch.object(
+                crawler, "STREAMING_PARSE_THRESHOLD", 100
+            ), patch.object(
+                # 작은 chunk로 멀티바이트 문자가 경계에서 잘리게 함
+                crawler,
+                "stream_item_fragments",
+                partial(stream_item_fragments, chunk_size=7),
+            ):
+                streamed = CrawlerService.stream_parse_list_page_items(
+                    option, html, set()
+                )
+
+            self.assertIsNotNone(streamed)
+            self.assertEqual(streamed[0], 20)
+            self.assertEqual(
+                [i.title for i in streamed[1][:2]],
+                ["게시글 0 — café", "게시글 1 — café"],
+            )
+
+
+class DetailPageParsingTest(TestCase):
+    """CrawlerService.parse_detail_page 테스트 (네트워크 호출 없이)"""
+
+    def test_image_falls_back_to_description(self) -> None:
+        """이미지 셀렉터 결과가 없으면 본문의 첫 이미지를 사용"""
+        from bs4 import BeautifulSoup
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services.crawler import CrawlerService
+
+        option = CrawlRequest(
+            url="https://example.com/list",
+            item_selector="article",
+            detail_title_selector="h1",
+            detail_description_selector=".content",
+        )
+        soup = BeautifulSoup(
+            '<h1>Title</h1><div class="content"><p>Body</p><img src="/a.png"></div>',
+            "html.parser",
+        )
+
+        parsed = CrawlerService.parse_detail_page(
+            option, soup, "https://example.com/posts/1"
+        )
+
+        self.assertEqual(parsed["title"], "Title")
+        self.assertEqual(parsed["image"], "https://example.com/a.png")
+        self.assertIn("Body", parsed["description"])
+
+    def test_detail_pages_are_fetched_concurrently_in_order(self) -> None:
+        """상세 페이지는 동시에 가져오되 호스트별 동시 요청 수를 제한하고 순서를 유지"""
+        import threading
+        import time
+        from unittest.mock import patch
+
+        from feeds.schemas.source import CrawlRequest
+        from feeds.services import crawler
+        from feeds.services.crawler import CrawlerService
+
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def fake_crawl_detail_page(option, detail_url, list_data):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            if detail_url.endswith("/3"):
+                raise Exception("boom")
+            return detail_url
+
+        option = CrawlRequest(url="https://example.com/list", item_selector="article")
+        tasks = [
+            {"detail_url": f"https://example.com/posts/{i}", "list_data": {}}
+            for i in range(8)
+        ]
+        limiter = crawler.HostConcurrencyLimiter(2)
+
+        with patch.object(
+            CrawlerService, "crawl_detail_page", side_effect=fake_crawl_detail_page
+        ), patch.object(crawler, "_detail_host_limiter", limiter):
+            found, items = CrawlerService.crawl_detail_pages(option, tasks)
+
+        self.assertEqual(found, 8)
+        self.assertEqual(
+            items, [t["detail_url"] for t in tasks if not t["detail_url"].endswith("/3")]
+        )
+        self.assertEqual(active["max"], 2)
+
+
+class PaginationUrlTest(TestCase):
+    """CrawlerService.generate_pagination_urls 테스트"""
+
+    def test_single_variable_replaces_every_occurrence(self) -> None:
+        """같은 플레이스홀더가 여러 번 나오면 모두 치환"""
+        from feeds.services.crawler import CrawlerService
+
+        urls = CrawlerService.generate_pagination_urls(
+            "https://example.com/{page}?p={page}",
+            [{"name": "page", "start": 1, "end": 5, "step": 2}],
+        )
+
+        self.assertEqual(
+            urls,
+            [
+                "https://example.com/1?p=1",
+                "https://example.com/3?p=3",
+                "https://example.com/5?p=5",
+            ],
+        )
+
+    def test_multiple_variables_keep_product_order(self) -> None:
+        """여러 변수는 선언 순서대로 모든 조합 생성, 다른 중괄호는 유지"""
+        from feeds.services.crawler import CrawlerService
+
+        urls = CrawlerService.generate_pagination_urls(
+            "https://example.com/{cat}/{page}?q={other}",
+            [
+                {"name": "cat", "start": 1, "end": 2},
+                {"name": "page", "start": 1, "end": 2},
+            ],
+        )
+
+        self.assertEqual(
+            urls,
+            [
+                "https://example.com/1/1?q={other}",
+                "https://example.com/1/2?q={other}",
+                "https://example.com/2/1?q={other}",
+                "https://example.com/2/2?q={other}",
+            ],
+        )
+
+
+class RSSSourceParsingTest(TestCase):
+    """CrawlerService.crawl_rss_source 테스트"""
+
+    RSS = """<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>T</title>
+      <item><title>Text</title><link>https://example.com/1</link>
+        <description>plain &lt;b&gt;text&lt;/b&gt; only</description></item>
+      <item><title>Image</title><link>https://example.com/2</link>
+        <description>&lt;p&gt;&lt;IMG src="https://example.com/a.png"&gt;&lt;/p&gt;</description></item>
+    </channel></rss>"""
+
+    def test_description_image_is_parsed_only_when_img_tag_present(self) -> None:
+        """description에 <img>가 없으면 HTML 파싱 없이 넘어감"""
+        from feeds.services import crawler
+        from feeds.services.crawler import CrawlerService
+
+        with patch.object(
+            crawler, "first_img_src", wraps=crawler.first_img_src
+        ) as mock_img_src:
+            found, items = CrawlerService.crawl_rss_source(self.RSS)
+
+        self.assertEqual(found, 2)
+        self.assertEqual([item.image for item in items], ["", "https://example.com/a.png"])
+        self.assertEqual(mock_img_src.call_count, 1)
@@ -4,7 +4,7 @@
 from django.test import TestCase
 from django.utils import timezone
 
-from feeds.models import RSSCategory, RSSFeed, RSSItem, RSSEverythingSource, FeedTaskResult
+from feeds.models import RSSCategory, RSSFeed, RSSItem, RSSEverythingSource, FeedTaskResult, RSSFeedSchedule
 from feeds.tests.conftest import BaseTestCase, unique_guid
 
 
@@ -41,6 +41,27 @@ class FeedModelTest(TestCase, BaseTestCase):
         self.assertEqual(item.feed, feed)
         self.assertFalse(item.is_read)
 
+    def test_item_guid_is_unique_per_feed(self) -> None:
+        """같은 guid는 피드마다 한 번씩 저장되고 같은 피드의 중복은 건너뜀"""
+        feed = self.create_feed(self.user, self.category, "Feed A")
+        other_feed = self.create_feed(self.user, self.category, "Feed B")
+        guid = unique_guid("shared")
+
+        def build(target):
+            return RSSItem(
+                feed=target,
+                title="Shared",
+                link="http://example.com/shared",
+                published_at=timezone.now(),
+                guid=guid,
+            )
+
+        RSSItem.objects.bulk_create([build(feed), build(other_feed)])
+        RSSItem.objects.bulk_create([build(feed)], ignore_conflicts=True)
+
+        self.assertEqual(RSSItem.objects.filter(guid=guid).count(), 2)
+        self.assertEqual(RSSItem.objects.filter(feed=feed, guid=guid).count(), 1)
+
 
 class RSSEverythingSourceTest(TestCase, BaseTestCase):
     """RSSEverythingSource 모델 테스트"""
@@ -152,3 +173,74 @@ class FeedTaskResultTest(TestCase, BaseTestCase):
         assert duration is not None
         self.assertGreaterEqual(duration, 9)
         self.assertLessEqual(duration, 11)
+
+
+class FeedScheduleTest(TestCase, BaseTestCase):
+    """피드 스케줄 (PeriodicTask 매핑) 테스트"""
+
+    def setUp(self) -> None:
+        self.user = self.create_user("schedulemodel")
+        self.category = self.create_category(self.user, "Schedule Category")
+
+    def test_schedule_follows_feed_rename(self) -> None:
+        """피드 저장 시 매핑된 task 하나만 갱신"""
+        from django_celery_beat.models import PeriodicTask
+
+        feed = self.create_feed(self.user, self.category, "Before")
+        task_id = RSSFeedSchedule.objects.get(feed=feed).periodic_task_id
+
+        feed.title = "After"
+        feed.save()
+
+        task = PeriodicTask.objects.get(feed_schedules__feed=feed)
+        self.assertEqual(task.pk, task_id)
+        self.assertEqual(task.name, "Update RSS feed: After")
+
+    def test_delete_removes_mapped_task(self) -> None:
+        """제목이 시그널 없이 바뀌어도 매핑으로 task를 삭제"""
+        from django_celery_beat.models import PeriodicTask
+
+        feed = self.create_feed(self.user, self.category, "Mapped")
+        task_id = RSSFeedSchedule.objects.get(feed=feed).periodic_task_id
+        RSSFeed.objects.filter(pk=feed.pk).update(title="Renamed")
+        feed.refresh_from_db()
+
+        feed.delete()
+
+        self.assertFalse(PeriodicTask.objects.filter(pk=task_id).exists())
+        self.assertFalse(RSSFeedSchedule.objects.exists())
+
+    def test_delete_removes_unmapped_legacy_task(self) -> None:
+        """매핑이 없는 예전 스케줄은 args 기준으로 삭제"""
+        from django_celery_beat.models import PeriodicTask
+
+        feed = self.create_feed(self.user, self.category, "Legacy")
+        task = PeriodicTask.objects.get(feed_schedules__feed=feed)
+        RSSFeedSchedule.objects.filter(feed=feed).delete()
+        PeriodicTask.objects.filter(pk=task.pk).update(name="Update RSS feed: Old title")
+
+        feed.delete()
+
+        self.assertFalse(PeriodicTask.objects.filter(pk=task.pk).exists())
+
+    def test_backfill_migration_links_existing_tasks(self) -> None:
+        """데이터 마이그레이션은 args로 매핑이 없는 피드의 task를 연결"""
+        from importlib import import_module
+
+        from django.apps import apps
+        from django_celery_beat.models import PeriodicTask
+
+        migration = import_module("feeds.migrations.0022_backfill_feed_schedules")
+        legacy = self.create_feed(self.user, self.category, "Legacy")
+        mapped = self.create_feed(self.user, self.category, "Mapped")
+        legacy_task_id = RSSFeedSchedule.objects.get(feed=legacy).periodic_task_id
+        mapped_task_id = RSSFeedSchedule.objects.get(feed=mapped).periodic_task_id
+        RSSFeedSchedule.objects.filter(feed=legacy).delete()
+
+        migration.backfill_feed_schedules(apps, None)
+
+        self.assertEqual(
+            dict(RSSFeedSchedule.objects.values_list("feed_id", "periodic_task_id")),
+            {legacy.pk: legacy_task_id, mapped.pk: mapped_task_id},
+        )
+        self.assertEqual(PeriodicTask.objects.count(), 2)
@@ -8,11 +8,12 @@ from django.test import TestCase
 from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from feeds.models import RSSCategory, RSSFeed, RSSItem
+from feeds.models import FeedTaskResult, RSSCategory, RSSFeed, RSSItem
 from feeds.schemas.feed import FeedCreateSchema, FeedUpdateSchema
 from feeds.services.category import CategoryService
 from feeds.services.feed import FeedService
 from feeds.services.item import ItemService
+from feeds.services.task_result import TaskResultService
 from feeds.tests.conftest import BaseTestCase
 
 
@@ -60,6 +61,93 @@ class QueryOptimizationTest(TestCase, BaseTestCase):
         # 최적화된 쿼리: Category 조회(1) + 단일 aggregate 쿼리(1)
         self.assertLessEqual(len(context.captured_queries), 3)
 
+    def test_task_stats_query_count(self) -> None:
+        """get_task_stats는 상태별 개수를 단일 aggregate 쿼리로 계산"""
+        feed = RSSFeed.objects.filter(user=self.user).first()
+        assert feed is not None
+        for status in [
+            FeedTaskResult.Status.SUCCESS,
+            FeedTaskResult.Status.SUCCESS,
+            FeedTaskResult.Status.FAILURE,
+            FeedTaskResult.Status.RUNNING,
+        ]:
+            FeedTaskResult.objects.create(feed=feed, status=status)
+        other = self.create_user("otherqueryuser")
+        other_feed = RSSFeed.objects.create(
+            user=other,
+            category=RSSCategory.objects.create(user=other, name="Other"),
+            title="Other Feed",
+        )
+        FeedTaskResult.objects.create(feed=other_feed)
+
+        with CaptureQueriesContext(connection) as context:
+            stats = TaskResultService.get_task_stats(self.user)
+
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(
+            stats,
+            {"total": 4, "success": 2, "failure": 1, "pending": 0, "running": 1},
+        )
+
+    def test_clear_task_results_single_delete(self) -> None:
+        """clear_task_results는 COUNT 없이 DELETE 한 번으로 삭제 개수를 반환"""
+        feed = RSSFeed.objects.filter(user=self.user).first()
+        assert feed is not None
+        for status in [FeedTaskResult.Status.SUCCESS, FeedTaskResult.Status.FAILURE]:
+            FeedTaskResult.objects.create(feed=feed, status=status)
+
+        with CaptureQueriesContext(connection) as context:
+            deleted = TaskResultService.clear_task_results(
+                self.user, status=FeedTaskResult.Status.FAILURE
+            )
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(FeedTaskResult.objects.filter(feed=feed).count(), 1)
+
+    def test_periodic_task_stats_query_count(self) -> None:
+        """주기적 태스크 통계는 매핑 조인 집계와 예전 태스크 확인 두 쿼리로 집계"""
+        from django_celery_beat.models import PeriodicTask
+
+        from feeds.services.periodic_task import PeriodicTaskService
+
+        feed = RSSFeed.objects.filter(user=self.user).first()
+        assert feed is not None
+        PeriodicTask.objects.filter(feed_schedules__feed=feed).update(enabled=False)
+        other = self.create_user("otherperiodicuser")
+        RSSFeed.objects.create(
+            user=other,
+            category=RSSCategory.objects.create(user=other, name="Other"),
+            title="Other Feed",
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            stats = PeriodicTaskService.get_task_stats(self.user)
+
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual(stats, {"total": 9, "enabled": 8, "disabled": 1})
+
+    def test_periodic_task_stats_include_unmapped_tasks(self) -> None:
+        """RSSFeedSchedule 매핑이 없는 예전 태스크는 args로 사용자의 피드인지 확인"""
+        from feeds.models import RSSFeedSchedule
+        from feeds.services.periodic_task import PeriodicTaskService
+
+        feed = RSSFeed.objects.filter(user=self.user).first()
+        assert feed is not None
+        other = self.create_user("otherlegacyuser")
+        other_feed = RSSFeed.objects.create(
+            user=other,
+            category=RSSCategory.objects.create(user=other, name="Other"),
+            title="Other Feed",
+        )
+        RSSFeedSchedule.objects.filter(feed__in=[feed, other_feed]).delete()
+
+        with CaptureQueriesContext(connection) as context:
+            stats = PeriodicTaskService.get_task_stats(self.user)
+
+        self.assertEqual(len(context.captured_queries), 3)
+        self.assertEqual(stats, {"total": 9, "enabled": 9, "disabled": 0})
+
 
 class ItemSearchTest(TestCase, BaseTestCase):
     """아이템 검색 테스트"""
@@ -212,3 +300,55 @@ class FeedServiceTest(TestCase, BaseTestCase):
         # 아이템이 삭제되었는지 확인
         remaining_count = RSSItem.objects.filter(feed=feed).count()
         self.assertEqual(remaining_count, 0)
+
+
+class ExistingGuidsTest(TestCase, BaseTestCase):
+    """ItemService.existing_guids 테스트"""
+
+    def setUp(self) -> None:
+        from feeds.services.item import _guid_cache
+
+        _guid_cache.clear()
+        self.user = self.create_user("guiduser")
+        self.category = self.create_category(self.user, "Guid Category")
+        self.feed = self.create_feed(self.user, self.category, "Guid Feed")
+        self.guids = [
+            item.guid for item in self.create_items_batch(self.feed, 50)
+        ]
+
+    def test_small_feed_uses_set(self) -> None:
+        """작은 피드는 GUID set 반환"""
+        guids = ItemService.existing_guids(self.feed.pk)
+
+        self.assertIsInstance(guids, set)
+        self.assertIn(self.guids[0], guids)
+
+    def test_large_feed_uses_bloom_filter(self) -> None:
+        """큰 피드는 블룸 필터 + DB 확인으로 조회"""
+        from unittest.mock import patch
+
+        with patch("feeds.services.item.GUID_SET_MAX_ITEMS", 10):
+            guids = ItemService.existing_guids(self.feed.pk)
+
+        self.assertNotIsInstance(guids, set)
+        self.assertTrue(all(guid in guids for guid in self.guids))
+        self.assertNotIn("guid-unknown", guids)
+        with CaptureQueriesContext(connection) as context:
+            self.assertIn(self.guids[1], guids)
+        self.assertEqual(len(context.captured_queries), 0)  # 확인 결과는 캐시됨
+
+    def test_cached_guids_only_read_new_items(self) -> None:
+        """두 번째 호출은 새로 추가된 아이템만 읽고, 삭제가 있으면 다시 전체를 읽음"""
+        first = ItemService.existing_guids(self.feed.pk)
+        new_item = self.create_item(self.feed, "New Item")
+
+        with CaptureQueriesContext(connection) as context:
+            second = ItemService.existing_guids(self.feed.pk)
+        self.assertIs(second, first)
+        self.assertIn(new_item.guid, second)
+        self.assertEqual(len(context.captured_queries), 2)  # 집계 + 새 행
+
+        RSSItem.objects.filter(guid=self.guids[0]).delete()
+        third = ItemService.existing_guids(self.feed.pk)
+        self.assertIsNot(third, first)
+        self.assertNotIn(self.guids[0], third)
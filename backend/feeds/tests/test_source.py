@@ -1,5 +1,493 @@
 # feeds/tests/test_source.py
 """RSSEverythingSource 관련 테스트 (test_models.py의 Source 테스트와 분리)"""
 
-# Source 관련 테스트는 test_models.py의 RSSEverythingSourceTest에 포함
-# 이 파일은 Source 서비스 레이어 테스트를 위해 예약됨
+# Source 모델 테스트는 test_models.py의 RSSEverythingSourceTest에 포함
+# 이 파일은 Source 서비스 레이어 테스트
+
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from feeds.crawlers import CrawlResult
+from feeds.models import RSSEverythingSource
+from feeds.schemas.source import CrawlRequest, SourceUpdateSchema
+from feeds.services.source import SourceService
+from feeds.tests.conftest import BaseTestCase
+
+
+# <tbody> 없이 <tr>을 <table> 바로 아래에 둔 게시판형 목록
+TABLE_HTML = (
+    '<table class="board">'
+    '<tr><td class="subject"><a href="/1">First</a></td><td class="summary">One</td></tr>'
+    '<tr><td class="subject"><a href="/2">Second</a></td><td class="summary">Two</td></tr>'
+    "</table>"
+)
+
+
+class SourceServiceTest(TestCase, BaseTestCase):
+    """SourceService CRUD 테스트"""
+
+    def setUp(self) -> None:
+        self.user = self.create_user("sourceuser")
+        self.category = self.create_category(self.user, "Source Category")
+        self.feed = self.create_feed(self.user, self.category, "Source Feed")
+
+    def test_refresh_sources_batches_task_results_and_dispatch(self) -> None:
+        """refresh_sources는 피드별 task 결과를 한 번에 만들고 task를 묶어서 발행"""
+        from feeds.models import FeedTaskResult
+
+        other_feed = self.create_feed(self.user, self.category, "Other Feed")
+        stranger = self.create_user("stranger")
+        stranger_feed = self.create_feed(
+            stranger, self.create_category(stranger, "Stranger"), "Stranger Feed"
+        )
+        sources = [
+            RSSEverythingSource.objects.create(feed=feed, url=f"https://example.com/{i}")
+            for i, feed in enumerate([self.feed, self.feed, other_feed, stranger_feed])
+        ]
+
+        with patch("feeds.tasks.update_feed_items.chunks") as mock_chunks:
+            with CaptureQueriesContext(connection) as context:
+                task_result_ids = SourceService.refresh_sources(
+                    self.user, [source.pk for source in sources]
+                )
+
+        inserts = [
+            q for q in context.captured_queries if q["sql"].startswith("INSERT")
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(len(task_result_ids), 2)
+        args, _ = mock_chunks.call_args
+        self.assertEqual(
+            args[0],
+            [(self.feed.pk, task_result_ids[0]), (other_feed.pk, task_result_ids[1])],
+        )
+        mock_chunks.return_value.apply_async.assert_called_once()
+        self.assertEqual(
+            FeedTaskResult.objects.filter(
+                id__in=task_result_ids, status=FeedTaskResult.Status.PENDING
+            ).count(),
+            2,
+        )
+
+    def test_update_feed_source_saves_only_changed_fields(self) -> None:
+        """update_feed_source는 변경된 필드만 UPDATE"""
+        source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            url="https://example.com/rss",
+            item_selector="article",
+        )
+        data = SourceUpdateSchema(url="https://example.com/new-rss")
+
+        with CaptureQueriesContext(connection) as context:
+            SourceService.update_feed_source(
+                self.user, self.feed.pk, source.pk, data
+            )
+
+        update_sql = next(
+            q["sql"] for q in context.captured_queries if q["sql"].startswith("UPDATE")
+        )
+        self.assertIn('"url"', update_sql)
+        self.assertNotIn('"item_selector"', update_sql)
+        source.refresh_from_db()
+        self.assertEqual(source.url, "https://example.com/new-rss")
+        self.assertEqual(source.item_selector, "article")
+
+    def test_update_source_skips_unchanged_fields(self) -> None:
+        """update_source는 값이 바뀐 필드만 저장하고, 바뀐 게 없으면 UPDATE하지 않음"""
+        source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            url="https://example.com/rss",
+            item_selector="article",
+            http_etag='"v1"',
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            SourceService.update_source(
+                self.user,
+                source.pk,
+                SourceUpdateSchema(url="https://example.com/rss", item_selector="article"),
+            )
+        self.assertFalse(
+            any(q["sql"].startswith("UPDATE") for q in context.captured_queries)
+        )
+
+        SourceService.update_source(
+            self.user,
+            source.pk,
+            SourceUpdateSchema(url="https://example.com/rss", author_selector=".by"),
+        )
+        source.refresh_from_db()
+        self.assertEqual(source.author_selector, ".by")
+        self.assertEqual(source.http_etag, "")
+
+    def test_list_sources_returns_user_sources(self) -> None:
+        """소스 목록 API는 사용자의 소스만 피드와 함께 한 쿼리로 조회"""
+        from ninja.testing import TestClient
+
+        from feeds.routers import rss_everything_router
+        from feeds.tests.conftest import create_auth_headers
+
+        for i in range(3):
+            RSSEverythingSource.objects.create(
+                feed=self.feed, url=f"https://example.com/{i}/rss"
+            )
+        other = self.create_user("othersource")
+        other_feed = self.create_feed(
+            other, self.create_category(other, "Other"), "Other Feed"
+        )
+        RSSEverythingSource.objects.create(feed=other_feed, url="https://other.com/rss")
+
+        with CaptureQueriesContext(connection) as context:
+            response = TestClient(rss_everything_router).get(
+                "", headers=create_auth_headers(self.user.pk)
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(source["url"] for source in response.json()),
+            [f"https://example.com/{i}/rss" for i in range(3)],
+        )
+        # 피드는 JOIN으로 함께 가져옴 (소스마다 추가 쿼리 없음)
+        self.assertEqual(
+            sum("rsseverythingsource" in q["sql"] for q in context.captured_queries), 1
+        )
+
+
+class ExtractElementsTest(TestCase):
+    """SourceService.extract_elements 테스트"""
+
+    def test_elements_are_limited_but_count_is_total(self) -> None:
+        """응답 요소는 제한되지만 count는 전체 매칭 수"""
+        html = "<ul>" + "".join(f"<li>Item {i}</li>" for i in range(60)) + "</ul>"
+
+        result = SourceService.extract_elements(html, "li", "https://example.com")
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.elements), 50)
+        self.assertEqual(result.count, 60)
+
+    def test_count_below_limit(self) -> None:
+        """제한보다 적게 매칭되면 그대로 반환"""
+        html = "<ul><li>A</li><li>B</li></ul>"
+
+        result = SourceService.extract_elements(html, "li", "https://example.com")
+
+        self.assertEqual(len(result.elements), 2)
+        self.assertEqual(result.count, 2)
+
+    def test_parsed_tree_is_reused_for_same_html(self) -> None:
+        """같은 HTML에 셀렉터만 바꿔 호출하면 한 번만 파싱"""
+        from feeds.services import source as source_module
+
+        html = '<ul><li class="a">A</li><li class="b"><a href="/b">B</a></li></ul>'
+        source_module._tree_cache.clear()
+        source_module._extract_cache.clear()
+
+        with patch.object(
+            source_module, "parse_lexbor", wraps=source_module.parse_lexbor
+        ) as mock_parse:
+            first = SourceService.extract_elements(html, "li.a", "https://example.com")
+            second = SourceService.extract_elements(html, "li a", "https://example.com")
+
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(first.elements[0].text, "A")
+        self.assertEqual(second.elements[0].href, "https://example.com/b")
+
+    def test_result_is_reused_for_same_html_and_selector(self) -> None:
+        """같은 HTML·셀렉터·기준 URL 조합은 추출 결과를 재사용"""
+        from feeds.services import source as source_module
+
+        html = '<ul><li class="a">A</li><li class="b">B</li></ul>'
+        source_module._extract_cache.clear()
+
+        with patch.object(
+            SourceService,
+            "_extract_elements_lexbor",
+            wraps=SourceService._extract_elements_lexbor,
+        ) as mock_extract:
+            first = SourceService.extract_elements(html, "li", "https://example.com")
+            again = SourceService.extract_elements(html, "li", "https://example.com")
+            other = SourceService.extract_elements(html, "li.b", "https://example.com")
+
+        self.assertEqual(mock_extract.call_count, 2)
+        self.assertEqual([el.text for el in again.elements], ["A", "B"])
+        self.assertEqual(again.count, first.count)
+        self.assertEqual([el.text for el in other.elements], ["B"])
+
+    def test_lexbor_path_matches_soup_path(self) -> None:
+        """lexbor 경로와 BeautifulSoup 경로의 요소 정보가 동일"""
+        html = (
+            '<div id="main"><ul><li class="item">One <a href="/1">link</a></li>'
+            '<li class="item"><img data-src="/2.png">Two</li></ul></div>'
+        )
+        base_url = "https://example.com/list"
+
+        fast, fast_count = SourceService._extract_elements_lexbor(
+            html, "li.item", base_url
+        )
+        slow, slow_count = SourceService._extract_elements_soup(
+            html, "li.item", base_url
+        )
+
+        self.assertEqual(fast_count, slow_count)
+        for a, b in zip(fast, slow):
+            self.assertEqual(
+                (a.tag, a.text, a.href, a.src, a.selector),
+                (b.tag, b.text, b.href, b.src, b.selector),
+            )
+        self.assertEqual(fast[1].selector, "#main > ul > li.item:nth-of-type(2)")
+
+    def test_table_row_selectors_match_crawl_tree(self) -> None:
+        """암묵적 tbody가 생기는 표에서도 크롤링(BeautifulSoup) 경로에서 매칭되는 셀렉터 생성"""
+        from feeds.services import source as source_module
+
+        source_module._extract_cache.clear()
+        result = SourceService.extract_elements(TABLE_HTML, "tr", "https://example.com")
+        selector = result.elements[1].selector
+        self.assertNotIn("tbody", selector)
+
+        option = CrawlRequest(
+            url="https://example.com/board",
+            source_type="page_scraping",
+            item_selector=selector,
+            title_selector="td.subject a",
+            description_selector="td.summary",
+            use_browser=False,
+        )
+        with patch(
+            "feeds.services.crawler.CrawlerService.fetch_html",
+            return_value=CrawlResult(success=True, html=TABLE_HTML),
+        ):
+            entries, items = SourceService.crawl(option)
+
+        self.assertEqual(entries, 1)
+        self.assertEqual(items[0].title, "Second")
+
+    def test_unsupported_selector_falls_back_to_soup(self) -> None:
+        """lexbor가 파싱하지 못하는 셀렉터는 soupsieve로 처리"""
+        html = "<ul><li>Apple</li><li>Banana</li></ul>"
+
+        result = SourceService.extract_elements(
+            html, 'li:-soup-contains("Banana")', "https://example.com"
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual([el.text for el in result.elements], ["Banana"])
+
+
+class SourceCrawlTest(TestCase):
+    """SourceService.crawl HTTP 우선 가져오기 테스트"""
+
+    LIST_HTML = '<ul><li class="entry"><a href="/1">First</a></li></ul>'
+    EMPTY_HTML = '<div id="app"></div>'
+
+    def _crawl(self, html_by_browser: dict[bool, str], **kwargs):
+        option = CrawlRequest(
+            url="https://example.com/list",
+            source_type="page_scraping",
+            item_selector="li.entry",
+            title_selector="a",
+        )
+
+        def fake_fetch(url, use_browser, **_):
+            return CrawlResult(success=True, html=html_by_browser[use_browser], url=url)
+
+        with patch(
+            "feeds.services.crawler.CrawlerService.fetch_html", side_effect=fake_fetch
+        ) as mock_fetch:
+            entries, items = SourceService.crawl(option, max_items=5, **kwargs)
+        return (
+            entries,
+            items,
+            [c.kwargs["use_browser"] for c in mock_fetch.call_args_list],
+        )
+
+    def test_prefer_http_skips_browser_when_items_found(self) -> None:
+        """HTTP로 아이템을 찾으면 브라우저를 사용하지 않음"""
+        entries, items, calls = self._crawl(
+            {False: self.LIST_HTML, True: self.EMPTY_HTML}, prefer_http=True
+        )
+
+        self.assertEqual(calls, [False])
+        self.assertEqual([item.title for item in items], ["First"])
+
+    def test_prefer_http_falls_back_to_browser(self) -> None:
+        """HTTP 결과에 아이템이 없으면 브라우저로 다시 가져옴"""
+        entries, items, calls = self._crawl(
+            {False: self.EMPTY_HTML, True: self.LIST_HTML}, prefer_http=True
+        )
+
+        self.assertEqual(calls, [False, True])
+        self.assertEqual(entries, 1)
+
+    def test_default_uses_source_setting(self) -> None:
+        """prefer_http 없이는 소스의 use_browser 설정을 그대로 사용"""
+        _, _, calls = self._crawl({False: self.EMPTY_HTML, True: self.LIST_HTML})
+
+        self.assertEqual(calls, [True])
+
+    def test_table_rows_match_with_and_without_description(self) -> None:
+        """`table > tr` 셀렉터는 설명 셀렉터 유무(lexbor/BeautifulSoup 경로)와 관계없이 같은 행을 찾음"""
+        for description_selector in ("", "td.summary"):
+            option = CrawlRequest(
+                url="https://example.com/board",
+                source_type="page_scraping",
+                item_selector="table.board > tr",
+                title_selector="td.subject a",
+                description_selector=description_selector,
+                use_browser=False,
+            )
+            with self.subTest(description_selector=description_selector), patch(
+                "feeds.services.crawler.CrawlerService.fetch_html",
+                return_value=CrawlResult(success=True, html=TABLE_HTML),
+            ):
+                entries, items = SourceService.crawl(option)
+
+                self.assertEqual(entries, 2)
+                self.assertEqual([item.title for item in items], ["First", "Second"])
+
+    def test_detail_links_in_table_rows_are_found(self) -> None:
+        """상세 링크 셀렉터가 `table > tr`을 가리켜도 BeautifulSoup 경로와 같은 링크를 찾음"""
+        cases = [
+            ("table.board > tr", "td.subject a", ["/1", "/2"]),
+            ("div.list", "table.board > tr a", ["/1"]),
+        ]
+        for item_selector, link_selector, expected in cases:
+            option = CrawlRequest(
+                url="https://example.com/board",
+                source_type="detail_page_scraping",
+                item_selector=item_selector,
+                link_selector=link_selector,
+                use_browser=False,
+            )
+            with self.subTest(item_selector=item_selector), patch(
+                "feeds.services.crawler.CrawlerService.fetch_html",
+                return_value=CrawlResult(
+                    success=True, html=f'<div class="list">{TABLE_HTML}</div>'
+                ),
+            ), patch(
+                "feeds.services.crawler.CrawlerService.crawl_detail_pages",
+                return_value=(0, []),
+            ) as mock_detail:
+                SourceService.crawl(option)
+
+                detail_urls = [d["detail_url"] for d in mock_detail.call_args.args[1]]
+                self.assertEqual(
+                    detail_urls, [f"https://example.com{path}" for path in expected]
+                )
+
+
+class ConditionalCrawlTest(TestCase, BaseTestCase):
+    """SourceService.crawl 조건부 요청(ETag/Last-Modified) 테스트"""
+
+    LIST_HTML = '<ul><li class="entry"><a href="/1">First</a></li></ul>'
+
+    def setUp(self) -> None:
+        self.user = self.create_user("conditionaluser")
+        self.category = self.create_category(self.user, "Conditional Category")
+        self.feed = self.create_feed(self.user, self.category, "Conditional Feed")
+        self.source = RSSEverythingSource.objects.create(
+            feed=self.feed,
+            source_type=RSSEverythingSource.SourceType.PAGE_SCRAPING,
+            url="https://example.com/list",
+            item_selector="li.entry",
+            title_selector="a",
+            use_browser=False,
+        )
+
+    def _crawl(self, fetch_result: CrawlResult):
+        option = CrawlRequest.from_orm(self.source)
+        with patch(
+            "feeds.services.crawler.CrawlerService.fetch_html",
+            return_value=fetch_result,
+        ) as mock_fetch:
+            entries, items = SourceService.crawl(
+                option, source=self.source, conditional=True
+            )
+        return entries, items, mock_fetch.call_args.kwargs["custom_headers"]
+
+    def test_stores_validators_from_response(self) -> None:
+        """응답의 ETag/Last-Modified를 소스 인스턴스에 반영 (저장은 호출하는 쪽에서)"""
+        entries, items, headers = self._crawl(
+            CrawlResult(
+                success=True,
+                html=self.LIST_HTML,
+                etag='"v1"',
+                last_modified="Wed, 21 Oct 2025 07:28:00 GMT",
+            )
+        )
+
+        self.assertNotIn("If-None-Match", headers)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(self.source.http_etag, '"v1"')
+        self.assertEqual(self.source.http_last_modified, "Wed, 21 Oct 2025 07:28:00 GMT")
+
+    def test_failed_parse_keeps_previous_validators(self) -> None:
+        """파싱에 실패하면 새 검증자를 반영하지 않아 다음 실행에서 다시 가져옴"""
+        self.source.http_etag = '"v1"'
+        with patch(
+            "feeds.services.source.SourceService._parse_html",
+            side_effect=ValueError("broken page"),
+        ), self.assertRaises(ValueError):
+            self._crawl(CrawlResult(success=True, html=self.LIST_HTML, etag='"v2"'))
+
+        self.assertEqual(self.source.http_etag, '"v1"')
+
+    def test_failed_detail_pages_clear_validators(self) -> None:
+        """상세 페이지 실패가 있으면 검증자를 비워 다음 실행에서 304로 건너뛰지 않음"""
+        self.source.source_type = RSSEverythingSource.SourceType.DETAIL_PAGE_SCRAPING
+        self.source.link_selector = "a"
+        self.source.http_etag = '"v1"'
+
+        def crawl_detail_page(option, detail_url, list_data):
+            if detail_url.endswith("/1"):
+                raise Exception("timeout")
+            return None
+
+        response = CrawlResult(
+            success=True,
+            html=self.LIST_HTML + '<ul><li class="entry"><a href="/2">Second</a></li></ul>',
+            etag='"v2"',
+        )
+        with patch(
+            "feeds.services.crawler.CrawlerService.crawl_detail_page",
+            side_effect=crawl_detail_page,
+        ):
+            self._crawl(response)
+        self.assertEqual(self.source.http_etag, "")
+
+        with patch(
+            "feeds.services.crawler.CrawlerService.crawl_detail_page", return_value=None
+        ):
+            self._crawl(response)
+        self.assertEqual(self.source.http_etag, '"v2"')
+
+    def test_not_modified_skips_parsing(self) -> None:
+        """저장된 검증자로 조건부 요청하고 304면 빈 결과 반환"""
+        self.source.http_etag = '"v1"'
+        self.source.save(update_fields=["http_etag"])
+
+        entries, items, headers = self._crawl(
+            CrawlResult(success=True, not_modified=True)
+        )
+
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual((entries, items), (0, []))
+
+    def test_update_source_clears_validators(self) -> None:
+        """소스 설정을 바꾸면 검증자를 초기화"""
+        self.source.http_etag = '"v1"'
+        self.source.save(update_fields=["http_etag"])
+
+        SourceService.update_feed_source(
+            self.user,
+            self.feed.pk,
+            self.source.pk,
+            SourceUpdateSchema(title_selector="h2"),
+        )
+
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.http_etag, "")
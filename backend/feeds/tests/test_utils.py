@@ -1,6 +1,7 @@
 # feeds/tests/test_utils.py
 """유틸리티 함수 테스트"""
 
+from contextlib import ExitStack
 from datetime import datetime
 from typing import Optional
 from unittest.mock import MagicMock, patch
@@ -177,6 +178,48 @@ class HTMLParserTest(TestCase):
         self.assertIn("https://example.com/image.jpg", result)
         self.assertIn("https://example.com/link", result)
 
+    def test_first_img_src(self) -> None:
+        """첫 번째 <img>의 src만 반환 (src가 없으면 빈 문자열)"""
+        from feeds.utils.html_parser import first_img_src
+
+        # lexbor 경로와 SoupStrainer 폴백 경로가 같은 결과를 내야 함
+        for lexbor in (True, False):
+            with self.subTest(lexbor=lexbor), ExitStack() as stack:
+                if not lexbor:
+                    stack.enter_context(patch("feeds.utils.html_parser.LexborHTMLParser", None))
+                self.assertEqual(first_img_src('<p><IMG SRC="/a.png?x=1&amp;y=2"></p>'), "/a.png?x=1&y=2")
+                self.assertEqual(first_img_src('<p>&lt;img src="x"&gt;</p><img src="b.png">'), "b.png")
+                self.assertEqual(first_img_src('<img><img src="c.png">'), "")
+                self.assertEqual(first_img_src("<p>no image</p>"), "")
+
+    def test_selectors_depend_on_tbody(self) -> None:
+        """tbody 유무에 따라 매칭이 달라지는 셀렉터만 감지"""
+        from feeds.utils.html_parser import selectors_depend_on_tbody
+
+        for selector in ["table.board > tr", "div TBODY a", "thead + tr", "tr:nth-child(2) a"]:
+            self.assertTrue(selectors_depend_on_tbody(["", selector]), selector)
+        for selector in ["tr.row", "table tr td a", "li.tr-row", "#tbody a", "tr:nth-of-type(2)"]:
+            self.assertFalse(selectors_depend_on_tbody(["", selector]), selector)
+
+    def test_extract_html_keeps_parent_context(self) -> None:
+        """표 행처럼 부모 문맥이 필요한 요소도 구조를 유지한 채 URL 변환"""
+        from feeds.utils.html_parser import extract_html
+
+        html = """<table><tr><td><img data-src="/lazy.png"><a href="/a?x=1&amp;y=2">A</a></td>
+        <td><video src="/v.mp4"><source src="/v.webm"></video></td></tr></table>"""
+        soup = BeautifulSoup(html, "html.parser")
+        element = soup.find("tr")
+        assert isinstance(element, Tag)
+
+        result = extract_html(element, "https://example.com")
+
+        self.assertTrue(result.startswith("<tr><td>"))
+        self.assertIn('data-src="https://example.com/lazy.png"', result)
+        self.assertIn('href="https://example.com/a?x=1&amp;y=2"', result)
+        self.assertIn('src="https://example.com/v.mp4"', result)
+        self.assertIn('src="https://example.com/v.webm"', result)
+        self.assertEqual(soup.find("img")["data-src"], "/lazy.png")  # 원본은 그대로
+
     def test_generate_selector(self) -> None:
         """CSS 셀렉터 생성 테스트"""
         from feeds.utils.html_parser import generate_selector
@@ -191,6 +234,279 @@ class HTMLParserTest(TestCase):
         # ID가 있는 부모가 있으면 해당 ID 포함
         self.assertIn("#main", selector)
 
+    def test_generate_selector_with_shared_cache(self) -> None:
+        """같은 모양의 형제도 각자의 위치로 구분하고, 캐시를 공유해도 결과가 같음"""
+        from selectolax.lexbor import LexborHTMLParser
+
+        from feeds.utils.html_parser import (
+            SelectorCache,
+            generate_selector,
+            lexbor_generate_selector,
+        )
+
+        html = '<div class="list"><ul><li>a</li><li>a</li><li>b</li></ul></div>'
+        expected = [
+            f"html > body > div.list > ul > li:nth-of-type({i})" for i in (1, 2, 3)
+        ]
+
+        soup = BeautifulSoup(f"<html><body>{html}</body></html>", "html.parser")
+        cache = SelectorCache()
+        self.assertEqual(
+            [generate_selector(soup, li, cache) for li in soup.find_all("li")],
+            expected,
+        )
+
+        tree = LexborHTMLParser(html)
+        cache = SelectorCache()
+        self.assertEqual(
+            [lexbor_generate_selector(li, cache) for li in tree.css("li")], expected
+        )
+        self.assertEqual(
+            [lexbor_generate_selector(li) for li in tree.css("li")], expected
+        )
+
+    def test_remove_elements(self) -> None:
+        """여러 제외 셀렉터를 한 번에 적용"""
+        from feeds.utils.html_parser import remove_elements
+
+        html = '<div><p class="ad">Ad</p><span>Keep</span><aside>Side</aside></div>'
+        soup = BeautifulSoup(html, "html.parser")
+
+        remove_elements(soup, [".ad", "aside", "  "])
+
+        self.assertEqual(soup.get_text(), "Keep")
+
+    def test_parse_lexbor_removes_excluded_tags(self) -> None:
+        """태그 제외 셀렉터와 일반 셀렉터를 함께 적용"""
+        from feeds.utils.html_parser import parse_lexbor, split_exclude_selectors
+
+        html = (
+            "<div><script>x</script><aside>a<aside>b</aside></aside>"
+            '<p class="ad">Ad</p><span>Keep</span></div>'
+        )
+
+        tree = parse_lexbor(html, ["script", "aside", ".ad", " "])
+
+        self.assertEqual(tree.body.text(), "Keep")
+        self.assertEqual(
+            split_exclude_selectors(["SCRIPT", "p.ad", "#nav", ""]),
+            (["script"], "p.ad, #nav"),
+        )
+
+    def test_join_url_matches_urljoin(self) -> None:
+        """join_url은 빠른 경로를 타더라도 urljoin과 같은 결과"""
+        from urllib.parse import urljoin
+
+        from feeds.utils.html_parser import join_url
+
+        bases = [
+            "https://example.com/list/page?p=2",
+            "HTTP://Example.com",
+            "ftp://example.com/a/",
+            "",
+        ]
+        links = [
+            "/posts/1",
+            "/posts/1?page=2#top",
+            "/",
+            "/a/../b",
+            "/a/./b",
+            "/a//b",
+            "/a;p",
+            "/a?",
+            "/a#",
+            "//cdn.example.com/x.png",
+            "https://other.example.com/x?y=1",
+            "HTTPS://other.example.com/x",
+            "https://other.example.com/a/../b",
+            " /leading-space",
+            "/tab\tinside",
+            "relative/path",
+            "../up",
+            "?q=1",
+            "#frag",
+            "mailto:a@example.com",
+            "",
+        ]
+
+        for base in bases:
+            for link in links:
+                self.assertEqual(join_url(base, link), urljoin(base, link), (base, link))
+
+    def test_compile_selector_is_cached(self) -> None:
+        """같은 셀렉터는 한 번만 컴파일하여 재사용"""
+        from feeds.utils.html_parser import compile_selector
+
+        soup = BeautifulSoup("<ul><li class='a'>1</li><li>2</li></ul>", "html.parser")
+
+        self.assertIs(compile_selector("li.a"), compile_selector("li.a"))
+        self.assertEqual(compile_selector("li.a").select_one(soup).text, "1")
+
+    def test_select_elements_simple_selector(self) -> None:
+        """단순 셀렉터(find_all 경로)와 CSS 셀렉터 결과가 동일"""
+        from feeds.utils.html_parser import compile_selector, select_elements
+
+        html = (
+            '<div><article class="post big">1</article><article>2</article>'
+            '<p class="post">3</p><p>4</p></div>'
+        )
+        soup = BeautifulSoup(html, "html.parser")
+
+        for selector in ["article", "article.post", ".post", "div > p"]:
+            self.assertEqual(
+                select_elements(soup, selector),
+                compile_selector(selector).select(soup),
+            )
+        self.assertEqual(len(select_elements(soup, "article", limit=1)), 1)
+
+    def test_item_strainer(self) -> None:
+        """아이템 서브트리만 파싱해도 아이템 선택 결과는 동일"""
+        from feeds.utils.html_parser import item_strainer, select_elements
+
+        html = (
+            "<html><head><style>p{}</style></head><body><div>"
+            '<article class="post"><p>1</p></article><article>2</article>'
+            "</div></body></html>"
+        )
+        strainer = item_strainer("article.post")
+        strained = BeautifulSoup(html, "html.parser", parse_only=strainer)
+        full = BeautifulSoup(html, "html.parser")
+
+        self.assertEqual(
+            [str(el) for el in select_elements(strained, "article.post")],
+            [str(el) for el in select_elements(full, "article.post")],
+        )
+        self.assertIsNotNone(strained.find("style"))
+        self.assertIsNone(strained.find("div"))
+        self.assertIsNone(item_strainer("div > article"))
+        self.assertIsNone(item_strainer("article.post", [".ad"]))
+
+    def test_item_strainer_class_only(self) -> None:
+        """클래스만 있는 셀렉터도 아이템 서브트리만 파싱 (중첩 아이템 포함)"""
+        from feeds.utils.html_parser import HTML_PARSER, item_strainer, select_elements
+
+        html = (
+            '<html><body><div class="wrap"><div class="post x">1'
+            '<span class="post">nested</span></div><p>skip</p>'
+            '<li class="post">2</li></div></body></html>'
+        )
+        for parser in ("html.parser", HTML_PARSER):
+            strained = BeautifulSoup(
+                html, parser, parse_only=item_strainer(".post", keep=())
+            )
+            full = BeautifulSoup(html, parser)
+
+            self.assertEqual(
+                [str(el) for el in select_elements(strained, ".post")],
+                [str(el) for el in select_elements(full, ".post")],
+            )
+            self.assertIsNone(strained.find("p"))
+
+    def test_lexbor_select_one_skips_self(self) -> None:
+        """lexbor_select_one은 BeautifulSoup처럼 하위 요소만 매칭"""
+        from feeds.utils.html_parser import lexbor_select_one, parse_lexbor
+
+        tree = parse_lexbor('<div class="a"><div class="a">inner</div></div>')
+        outer = tree.css_first("div.a")
+
+        self.assertEqual(lexbor_select_one(outer, "div.a").text(), "inner")
+        self.assertIsNone(lexbor_select_one(outer, "p"))
+
+    def test_truncate_html(self) -> None:
+        """잘라낸 직렬화 결과가 str(element)[:limit]와 동일"""
+        from feeds.utils.html_parser import truncate_html
+
+        html = '<div class="a" data-x="&quot;1"><p>a &amp; <b>b</b><!--c--></p><br/>tail</div>'
+        element = BeautifulSoup(html, "html.parser").div
+        full = str(element)
+
+        for limit in range(len(full) + 2):
+            self.assertEqual(truncate_html(element, limit), full[:limit])
+
+    def test_extract_css_fetches_stylesheets_concurrently_in_order(self) -> None:
+        """외부 스타일시트는 동시에 가져오고 문서 순서대로 합침"""
+        import threading
+
+        from feeds.utils import html_parser
+
+        html = """<html><head><style>p { color: red; }</style>
+        <link rel="stylesheet" href="/a.css"><link rel="stylesheet" href="/b.css">
+        </head><body></body></html>"""
+        # 두 요청이 동시에 진행 중이어야 통과하는 배리어
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fake_get(url, **kwargs):
+            barrier.wait()
+            return MagicMock(status_code=200, text=url.rsplit("/", 1)[1])
+
+        html_parser._css_cache.clear()
+        with patch.object(html_parser._css_http, "get", side_effect=fake_get):
+            css = html_parser.extract_css_from_html(
+                BeautifulSoup(html, "html.parser"), "https://example.com/"
+            )
+
+        self.assertEqual(
+            css,
+            "p { color: red; }\n"
+            "/* From: https://example.com/a.css */\na.css\n"
+            "/* From: https://example.com/b.css */\nb.css",
+        )
+
+    def test_extract_css_fetches_each_stylesheet_once(self) -> None:
+        """중복 링크와 다른 페이지의 같은 스타일시트는 다시 요청하지 않음"""
+        from feeds.utils import html_parser
+
+        html = """<html><head>
+        <link rel="stylesheet" href="/site.css"><link rel="stylesheet" href="/site.css">
+        </head><body></body></html>"""
+        html_parser._css_cache.clear()
+        response = MagicMock(status_code=200, text="body { margin: 0; }")
+
+        with patch.object(html_parser._css_http, "get", return_value=response) as mock_get:
+            first = html_parser.extract_css_from_html(
+                BeautifulSoup(html, "html.parser"), "https://example.com/posts/1"
+            )
+            second = html_parser.extract_css_from_html(
+                BeautifulSoup(html, "html.parser"), "https://example.com/posts/2"
+            )
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first.count("body { margin: 0; }"), 1)
+
+
+class HTMLUtilsTest(TestCase):
+    """html_utils.strip_html_tags 테스트"""
+
+    CASES = [
+        ("<p>Hello &amp; <b>world</b></p>", "Hello & world"),
+        ("a<br>b", "a b"),
+        ("<style>.x{color:red}</style><div>T&lt;1&gt;</div><script>var a='<p>';</script>", "T<1>"),
+        ("<!-- comment --><p>  spaced\n  text </p>", "spaced text"),
+        ("", ""),
+    ]
+
+    def test_strip_html_tags(self) -> None:
+        """태그/script/style/주석을 제거하고 엔티티를 디코딩"""
+        from feeds.utils.html_utils import strip_html_tags
+
+        for html, expected in self.CASES:
+            self.assertEqual(strip_html_tags(html), expected, html)
+
+    def test_regex_fallback_matches(self) -> None:
+        """selectolax가 없을 때의 정규식 경로도 같은 결과"""
+        from feeds.utils import html_utils
+
+        with patch.object(html_utils, "LexborHTMLParser", None):
+            for html, expected in self.CASES:
+                self.assertEqual(html_utils.strip_html_tags(html), expected, html)
+
+    def test_literal_angle_brackets_are_kept(self) -> None:
+        """태그가 아닌 부등호는 텍스트로 유지"""
+        from feeds.utils.html_utils import strip_html_tags
+
+        self.assertEqual(strip_html_tags("1 < 2 and 3 > 2"), "1 < 2 and 3 > 2")
+
 
 class RSSFetcherTest(TestCase):
     """RSS 피드 가져오기 유틸리티 테스트 (네트워크 호출 mocking)"""
@@ -239,3 +555,51 @@ class RSSFetcherTest(TestCase):
                 feed_dict = getattr(result, "feed", {})
                 self.assertEqual(feed_dict.get("title"), "Test Feed")
                 self.assertEqual(len(result.entries), 1)
+
+
+class PooledHTTPTest(TestCase):
+    """PooledHTTP 커넥션 재사용 테스트 (로컬 HTTP 서버 사용)"""
+
+    def test_sessions_share_keep_alive_connection(self) -> None:
+        """세션은 매번 새로 만들어도 같은 호스트의 TCP 연결을 재사용"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from base.utils import PooledHTTP
+
+        client_ports = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                client_ports.append(self.client_address[1])
+                body = b"ok"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Set-Cookie", "sid=1")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        # keep-alive 연결이 열려 있어도 shutdown이 끝나도록 요청마다 데몬 스레드로 처리
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            http = PooledHTTP()
+            url = f"http://127.0.0.1:{server.server_port}/"
+            first = http.get(url, timeout=5)
+            second = http.get(url, timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual((first.text, second.text), ("ok", "ok"))
+        self.assertEqual(len(client_ports), 2)
+        self.assertEqual(client_ports[0], client_ports[1])
+        # 쿠키는 요청 간에 공유하지 않음
+        self.assertEqual(len(http.session().cookies), 0)
@@ -2,10 +2,31 @@
 HTML Parser Utilities - 웹 페이지 파싱 및 크롤링 관련 유틸리티 함수
 """
 
-from typing import Optional, TypedDict
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache
+from typing import Any, Iterator, Optional, TypedDict
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from urllib.parse import urljoin, urlsplit
 import re
+import soupsieve
+
+from base.utils import PooledHTTP, TTLCache
+
+try:
+    from lxml import etree
+
+    # C 기반 파서 (html.parser 대비 수 배 빠름)
+    HTML_PARSER = "lxml"
+except ImportError:
+    etree = None
+    HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:  # selectolax가 없으면 BeautifulSoup 경로만 사용
+    LexborHTMLParser = None
+    LexborNode = Any
 
 # 타입 정의
 class ExtractedElement(TypedDict):
@@ -17,42 +38,230 @@ class ExtractedElement(TypedDict):
     src: Optional[str]
     selector: str
 
-def generate_selector(soup: BeautifulSoup, element) -> str:
-    """요소에 대한 고유한 CSS 셀렉터 생성"""
-    parts = []
+@lru_cache(maxsize=1024)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """CSS 셀렉터를 컴파일하여 프로세스 단위로 캐시
+
+    미리보기/크롤링 요청마다 같은 사용자 셀렉터가 반복되므로
+    셀렉터 해석 비용을 요청 간에 공유한다.
+    """
+    return soupsieve.compile(selector)
+
+# 외부 스타일시트 요청용 keep-alive 커넥션 풀
+_css_http = PooledHTTP()
+# 문서당 가져오는 외부 스타일시트 최대 수 (동시에 요청)
+MAX_EXTERNAL_STYLESHEETS = 5
+# 같은 사이트의 페이지들은 대부분 같은 스타일시트를 공유하므로 URL별로 잠시 보관
+CSS_CACHE_SIZE = 64
+CSS_CACHE_TTL = 600  # 초
+_css_cache: TTLCache[str, str] = TTLCache(CSS_CACHE_SIZE, CSS_CACHE_TTL)
+
+# "article", ".post", "li.entry" 처럼 태그/클래스 하나로 된 단순 셀렉터
+SIMPLE_SELECTOR_RE = re.compile(r"^([a-zA-Z][\w-]*)?(?:\.([\w-]+))?$")
+
+@lru_cache(maxsize=1024)
+def parse_simple_selector(selector: str) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """단순 셀렉터면 (태그, 클래스) 반환, 아니면 None"""
+    match = SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    tag, class_name = match.groups()
+    return (tag.lower() if tag else None, class_name)
+
+# urljoin이 입력을 그대로 이어 붙이는 평범한 링크 형태
+# (공백/제어문자, 빈 경로 세그먼트, ./.. 세그먼트, ;params, 빈 query/fragment가 없는 경우)
+_URL_SEGMENT = r"(?!\.\.?(?![^/?#]))[A-Za-z0-9\-._~!$&'()*+,=:@%]+"
+_URL_PATH = rf"(?:/{_URL_SEGMENT})*/?"
+_URL_TAIL = (
+    r"(?:\?[A-Za-z0-9\-._~!$&'()*+,;=:@%/?]+)?"
+    r"(?:#[A-Za-z0-9\-._~!$&'()*+,;=:@%/?#]+)?"
+)
+ROOT_RELATIVE_URL_RE = re.compile(rf"(?!//){_URL_PATH}{_URL_TAIL}")
+ABSOLUTE_HTTP_URL_RE = re.compile(rf"https?://[A-Za-z0-9\-.]+(?::\d+)?{_URL_PATH}{_URL_TAIL}")
+
+@lru_cache(maxsize=256)
+def _url_origin(base_url: str) -> Optional[str]:
+    """http(s) 기준 URL의 "scheme://netloc" (그 외에는 None)"""
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+def join_url(base_url: str, url: str) -> str:
+    """
+    urljoin과 같은 결과를 반환하되, 흔한 형태의 링크는 문자열 연결로 처리
+
+    기준 URL 분석은 캐시하고, 절대 http(s) 링크와 "/"로 시작하는 평범한 링크만
+    urljoin을 거치지 않는다. 나머지는 모두 urljoin에 맡긴다.
+    """
+    origin = _url_origin(base_url) if url else None
+    if origin is not None:
+        if url[0] == "/":
+            if ROOT_RELATIVE_URL_RE.fullmatch(url):
+                return origin + url
+        elif ABSOLUTE_HTTP_URL_RE.fullmatch(url):
+            return url
+    return urljoin(base_url, url)
+
+def select_elements(root, selector: str, limit: Optional[int] = None) -> list:
+    """CSS 셀렉터로 요소 선택 (단순 셀렉터는 CSS 엔진 대신 find_all 사용)"""
+    simple = parse_simple_selector(selector)
+    if simple is None:
+        return compile_selector(selector).select(root, limit=limit or 0)
+    tag, class_name = simple
+    if class_name:
+        return root.find_all(tag or True, class_=class_name, limit=limit)
+    return root.find_all(tag, limit=limit)
+
+class ItemStrainer(SoupStrainer):
+    """태그/클래스 조건에 맞는 아이템 요소(+ keep 태그)의 서브트리만 파싱하는 strainer
+
+    BeautifulSoup은 이미 만든 서브트리 바깥의 태그에 대해서만 allow_tag_creation을
+    호출하므로, 아이템 안쪽의 요소는 조건과 관계없이 모두 유지된다.
+    """
+
+    def __init__(self, tag: Optional[str], class_name: Optional[str], keep: tuple[str, ...]):
+        # 인자 없는 SoupStrainer는 태그만 매칭 (최상위 문자열은 버림)
+        super().__init__()
+        self.item_tag = tag
+        self.item_class = class_name
+        self.keep = frozenset(keep)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in self.keep:
+            return True
+        if self.item_tag is not None and name != self.item_tag:
+            return False
+        if self.item_class is None:
+            return True
+        classes = (attrs or {}).get("class") or ""
+        if isinstance(classes, str):
+            classes = classes.split()
+        return self.item_class in classes
+
+def item_strainer(
+    item_selector: str,
+    exclude_selectors: list[str] = [],
+    keep: tuple[str, ...] = ("style", "link"),
+) -> Optional[SoupStrainer]:
+    """아이템 서브트리(+ keep 태그)만 파싱하는 strainer 생성
+
+    "article", ".post", "li.entry" 같은 단순 셀렉터일 때만 사용한다.
+    제외 셀렉터는 아이템 바깥 요소를 가리킬 수 있으므로 있으면 None을 반환한다.
+    keep 기본값은 extract_html_with_css에 필요한 style/link 태그.
+    """
+    if any(s and s.strip() for s in exclude_selectors):
+        return None
+    simple = parse_simple_selector(item_selector) if item_selector else None
+    if simple is None:
+        return None
+    tag, class_name = simple
+    return ItemStrainer(tag, class_name, keep)
+
+class SelectorCache:
+    """
+    여러 요소의 셀렉터를 연달아 만들 때 공유하는 계산 결과
+
+    목록의 형제 요소들은 부모까지의 셀렉터와 형제 위치가 같으므로
+    노드별 셀렉터와 부모별 형제 위치를 한 번만 계산한다.
+    """
+
+    def __init__(self) -> None:
+        # 노드 키 → 그 노드의 전체 셀렉터
+        self.selectors: dict[int, str] = {}
+        # 부모 노드 키 → {자식 노드 키: (같은 태그 중 순서, 같은 태그 수)}
+        self.positions: dict[int, dict[int, tuple[int, int]]] = {}
+
+def _class_suffix(classes: list[str]) -> str:
+    """해시처럼 보이는 클래스를 뺀 앞의 두 클래스를 셀렉터 조각으로"""
+    stable_classes = [c for c in classes if not re.match(r"^[a-z]+-[a-f0-9]+$", c, re.I)]
+    return "." + ".".join(stable_classes[:2]) if stable_classes else ""
+
+def _sibling_positions(children) -> dict[int, tuple[int, int]]:
+    """(노드 키, 태그) 목록에서 노드별 (같은 태그 중 순서, 같은 태그 수) 계산"""
+    counts: dict[str, int] = {}
+    indexed = []
+    for key, tag in children:
+        if tag:
+            counts[tag] = counts.get(tag, 0) + 1
+            indexed.append((key, tag, counts[tag]))
+    return {key: (index, counts[tag]) for key, tag, index in indexed}
+
+def _join_selector_chain(cache: SelectorCache, chain: list[tuple[int, str]], prefix: str) -> str:
+    """요소 → 조상 순의 셀렉터 조각을 조상부터 이어 붙이며 노드별 셀렉터를 캐시에 저장"""
+    selector = prefix
+    for key, part in reversed(chain):
+        selector = f"{selector} > {part}" if selector else part
+        cache.selectors[key] = selector
+    return selector
+
+def generate_selector(soup: BeautifulSoup, element, cache: Optional[SelectorCache] = None) -> str:
+    """
+    요소에 대한 고유한 CSS 셀렉터 생성
+
+    여러 요소를 처리할 때 같은 cache를 넘기면 공통 조상의 셀렉터와
+    형제 위치를 요소마다 다시 계산하지 않는다.
+    """
+    if cache is None:
+        cache = SelectorCache()
+    chain = []
+    prefix = ""
     current = element
 
     while current and current.name:
         if current.name == "[document]":
             break
 
-        selector = current.name
+        key = id(current)
+        if key in cache.selectors:
+            prefix = cache.selectors[key]
+            break
 
         if current.get("id"):
-            selector = f"#{current.get('id')}"
-            parts.insert(0, selector)
+            chain.append((key, f"#{current.get('id')}"))
             break
 
-        classes = current.get("class", [])
-        if classes:
-            stable_classes = [
-                c for c in classes if not re.match(r"^[a-z]+-[a-f0-9]+$", c, re.I)
-            ]
-            if stable_classes:
-                selector += "." + ".".join(stable_classes[:2])
-
-        if current.parent:
-            siblings = [
-                s for s in current.parent.children if s.name == current.name
-            ]
-            if len(siblings) > 1:
-                index = siblings.index(current) + 1
+        selector = current.name + _class_suffix(current.get("class", []))
+
+        parent = current.parent
+        if parent:
+            positions = cache.positions.get(id(parent))
+            if positions is None:
+                positions = cache.positions[id(parent)] = _sibling_positions(
+                    (id(s), s.name) for s in parent.children
+                )
+            index, count = positions[key]
+            if count > 1:
                 selector += f":nth-of-type({index})"
 
-        parts.insert(0, selector)
-        current = current.parent
+        chain.append((key, selector))
+        current = parent
+
+    return _join_selector_chain(cache, chain, prefix)
 
-    return " > ".join(parts)
+def split_exclude_selectors(selectors: list[str]) -> tuple[list[str], str]:
+    """제외 셀렉터를 태그 이름만으로 된 것과 나머지(콤마로 합친 셀렉터)로 분리"""
+    tags = []
+    others = []
+    for selector in selectors:
+        if not selector or not selector.strip():
+            continue
+        simple = parse_simple_selector(selector)
+        if simple is not None and simple[1] is None:
+            tags.append(simple[0])
+        else:
+            others.append(selector)
+    return tags, ", ".join(others)
+
+def remove_elements(soup: BeautifulSoup, selectors: list[str]) -> None:
+    """셀렉터 목록에 해당하는 요소들을 제거 (script/style 같은 태그는 CSS 엔진 없이 직접 탐색)"""
+    tags, combined = split_exclude_selectors(selectors)
+    if tags:
+        for el in soup.find_all(tags):
+            el.decompose()
+    if combined:
+        for el in compile_selector(combined).select(soup):
+            el.decompose()
 
 def extract_text(element) -> str:
     """요소에서 텍스트 추출"""
@@ -60,10 +269,68 @@ def extract_text(element) -> str:
         return ""
     return element.get_text(strip=True)
 
+def truncate_html(element, limit: int) -> str:
+    """요소를 HTML로 직렬화하되 limit 글자에 도달하면 중단
+
+    str(element)[:limit]와 같은 결과를 내지만, 큰 서브트리 전체를
+    직렬화한 뒤 잘라내지 않고 필요한 만큼만 직렬화한다.
+    """
+    parts: list[str] = []
+    remaining = limit
+
+    def walk(node) -> bool:
+        nonlocal remaining
+        if not isinstance(node, Tag) or not node.contents:
+            chunk = str(node) if isinstance(node, Tag) else node.output_ready()
+            parts.append(chunk[:remaining])
+            remaining -= len(chunk)
+            return remaining > 0
+        if isinstance(node, BeautifulSoup):
+            # 문서 루트는 자식만 직렬화됨
+            return all(walk(child) for child in node.contents)
+
+        closing = f"</{node.prefix + ':' if node.prefix else ''}{node.name}>"
+        # 자식 없는 껍데기 태그로 여는 태그만 직렬화
+        shell = Tag(
+            builder=node.builder,
+            name=node.name,
+            attrs=node.attrs,
+            prefix=node.prefix,
+            namespace=node.namespace,
+        )
+        opening = str(shell)[: -len(closing)]
+        parts.append(opening[:remaining])
+        remaining -= len(opening)
+        if remaining <= 0:
+            return False
+        for child in node.contents:
+            if not walk(child):
+                return False
+        parts.append(closing[:remaining])
+        remaining -= len(closing)
+        return remaining > 0
+
+    if limit > 0:
+        walk(element)
+    return "".join(parts)
+
+def _fetch_css(css_url: str) -> Optional[str]:
+    """외부 스타일시트 본문 (실패하면 None, 성공한 결과만 캐시)"""
+    css_text = _css_cache.get(css_url)
+    if css_text is not None:
+        return css_text
+    try:
+        response = _css_http.get(css_url, timeout=3)
+    except Exception:
+        # 로깅은 호출자에서 처리
+        return None
+    if response.status_code != 200:
+        return None
+    _css_cache.set(css_url, response.text)
+    return response.text
+
 def extract_css_from_html(soup: BeautifulSoup, base_url: str = "") -> str:
     """HTML 문서에서 모든 CSS를 추출"""
-    import requests
-
     css_parts = []
 
     for style_tag in soup.find_all("style"):
@@ -71,32 +338,40 @@ def extract_css_from_html(soup: BeautifulSoup, base_url: str = "") -> str:
         if css_text.strip():
             css_parts.append(css_text)
 
-    link_tags = soup.find_all("link", rel="stylesheet")
-    for link_tag in link_tags[:5]:
+    css_urls = []
+    for link_tag in soup.find_all("link", rel="stylesheet")[:MAX_EXTERNAL_STYLESHEETS]:
         href = link_tag.get("href")
         if not href:
             continue
         if not isinstance(href, str):
             continue
+        css_urls.append(urljoin(base_url, href))
+    # 같은 스타일시트를 여러 번 링크한 문서도 한 번만 요청
+    css_urls = list(dict.fromkeys(css_urls))
 
-        css_url = urljoin(base_url, href)
-
-        try:
-            response = requests.get(css_url, timeout=3)
-            if response.status_code == 200:
-                css_parts.append(f"/* From: {css_url} */\n{response.text}")
-        except Exception as e:
-            # 로깅은 호출자에서 처리
-            continue
+    if css_urls:
+        # 동시에 가져오되 캐스케이드 순서가 바뀌지 않도록 문서 순서대로 합침
+        with ThreadPoolExecutor(max_workers=len(css_urls)) as executor:
+            for css_url, css_text in zip(css_urls, executor.map(_fetch_css, css_urls)):
+                if css_text is not None:
+                    css_parts.append(f"/* From: {css_url} */\n{css_text}")
 
     return "\n".join(css_parts)
 
-def extract_html_with_css(element, soup: BeautifulSoup, base_url: str = "") -> str:
-    """요소의 HTML 블록과 함께 CSS를 추출"""
+def extract_html_with_css(
+    element, soup: BeautifulSoup, base_url: str = "", css: Optional[str] = None
+) -> str:
+    """
+    요소의 HTML 블록과 함께 CSS를 추출
+
+    같은 문서의 여러 요소를 처리할 때는 extract_css_from_html 결과를 css로 넘겨
+    문서 전체 탐색과 외부 스타일시트 요청을 요소마다 반복하지 않도록 한다.
+    """
     if element is None:
         return ""
 
-    css = extract_css_from_html(soup, base_url)
+    if css is None:
+        css = extract_css_from_html(soup, base_url)
     html = extract_html(element, base_url)
 
     if css.strip():
@@ -104,12 +379,42 @@ def extract_html_with_css(element, soup: BeautifulSoup, base_url: str = "") -> s
 
     return html
 
+# 상대 URL을 절대 URL로 바꿀 태그별 속성
+_URL_ATTRS = {
+    "img": ("src", "data-src", "data-lazy-src"),
+    "a": ("href",),
+    "video": ("src",),
+    "source": ("src",),
+    "audio": ("src",),
+}
+
 def extract_html(element, base_url: str = "") -> str:
     """요소의 HTML 블록 전체를 추출 (상대 URL을 절대 URL로 변환)"""
     if element is None:
         return ""
-
-    from copy import copy
+    if not base_url:
+        return str(element)
+
+    if LexborHTMLParser is not None and element.name not in ("html", "head", "body"):
+        # 요소를 통째로 복사해 속성을 고치는 대신 한 번 직렬화한 HTML을
+        # lexbor로 다시 읽어 C 파서/직렬화기에서 고침 (큰 본문에서 2배 이상 빠름)
+        parent = element.parent
+        parent_tag = "div"
+        if parent is not None and parent.name != "[document]":
+            parent_tag = parent.name
+        if element.name == "tr" and parent_tag == "table":
+            parent_tag = "tbody"  # html.parser 트리는 tbody 없이 tr을 table에 바로 둠
+        tree = parse_lexbor_fragment(str(element), parent_tag)
+        for node in tree.css(", ".join(_URL_ATTRS)):
+            attrs = node.attrs
+            for attr in _URL_ATTRS[node.tag]:
+                value = attrs.get(attr)
+                if value:
+                    attrs[attr] = join_url(base_url, value)
+        html = tree.html or ""
+        # 문맥 때문에 구조가 바뀌었으면 (암묵적 태그 삽입 등) 복사 경로 사용
+        if html.startswith(f"<{element.name}"):
+            return html
 
     element_copy = copy(element)
 
@@ -117,15 +422,15 @@ def extract_html(element, base_url: str = "") -> str:
         for img in element_copy.find_all("img"):
             for attr in ["src", "data-src", "data-lazy-src"]:
                 if img.get(attr):
-                    img[attr] = urljoin(base_url, img[attr])
+                    img[attr] = join_url(base_url, img[attr])
 
         for a in element_copy.find_all("a"):
             if a.get("href"):
-                a["href"] = urljoin(base_url, a["href"])
+                a["href"] = join_url(base_url, a["href"])
 
         for media in element_copy.find_all(["video", "source", "audio"]):
             if media.get("src"):
-                media["src"] = urljoin(base_url, media["src"])
+                media["src"] = join_url(base_url, media["src"])
 
     return str(element_copy)
 
@@ -141,7 +446,7 @@ def extract_href(element, base_url: str) -> str:
             href = a_tag.get("href")
 
     if href:
-        return urljoin(base_url, href)
+        return join_url(base_url, href)
     return ""
 
 def extract_src(element, base_url: str) -> str:
@@ -164,5 +469,214 @@ def extract_src(element, base_url: str) -> str:
             )
 
     if src:
-        return urljoin(base_url, src)
+        return join_url(base_url, src)
     return ""
+
+# ==========================================
+# selectolax(lexbor) 어댑터 - 텍스트/속성만 필요한 빠른 경로용
+# ==========================================
+
+_TBODY_TAG_RE = re.compile(r"<tbody\b", re.IGNORECASE)
+# tbody 유무로 결과가 달라지는 셀렉터: tbody 자체, 결합자 바로 뒤의 tr, tr의 자식 순서 의사 클래스
+_TBODY_SELECTOR_RE = re.compile(
+    r"(?<![\w.#-])tbody(?![\w-])"
+    r"|[>+~]\s*tr(?![\w-])"
+    r"|(?<![\w.#-])tr(?![\w-])[^\s>+~,]*:(?:nth-child|nth-last-child|first-child|last-child|only-child)",
+    re.IGNORECASE,
+)
+
+def lexbor_inserted_tbody(tree: "LexborHTMLParser", html: str) -> bool:
+    """
+    lexbor가 HTML5 규칙대로 넣은 암묵적 <tbody>가 있는지
+
+    lxml/html.parser는 <table> 바로 아래의 <tr>을 그대로 두므로 이 경우
+    `table > tr` 같은 셀렉터가 BeautifulSoup 트리와 다르게 매칭된다.
+    """
+    return len(tree.css("tbody")) > len(_TBODY_TAG_RE.findall(html))
+
+def selectors_depend_on_tbody(selectors) -> bool:
+    """셀렉터 중 tbody 유무에 따라 매칭이 달라지는 것이 있는지 (`table > tr` 등)"""
+    return any(selector and _TBODY_SELECTOR_RE.search(selector) for selector in selectors)
+
+def parse_lexbor(html: str, exclude_selectors: list[str] = [], selectors=()):
+    """
+    lexbor로 파싱하고 제외 셀렉터 요소를 제거 (selectolax가 없으면 None)
+
+    selectors(제외 셀렉터 포함)가 tbody 유무에 의존하는데 lexbor가 tbody를 넣었다면
+    BeautifulSoup 경로와 결과가 달라지므로 None을 반환한다.
+    """
+    if LexborHTMLParser is None:
+        return None
+    tree = LexborHTMLParser(html)
+    if selectors_depend_on_tbody(
+        [*selectors, *exclude_selectors]
+    ) and lexbor_inserted_tbody(tree, html):
+        return None
+    tags, combined = split_exclude_selectors(exclude_selectors)
+    if tags:
+        tree.strip_tags(tags)
+    if combined:
+        for node in tree.css(combined):
+            node.decompose()
+    return tree
+
+def parse_lexbor_fragment(html: str, parent_tag: str = "div"):
+    """HTML 조각을 원래 부모 태그 문맥으로 파싱 (tr, li 등이 유지되도록)"""
+    if LexborHTMLParser is None:
+        return None
+    return LexborHTMLParser(html, is_fragment=True, fragment_tag=parent_tag)
+
+def lexbor_select_one(node: "LexborNode", selector: str) -> Optional["LexborNode"]:
+    """node의 하위 요소 중 첫 번째 매칭 (lexbor는 node 자신도 매칭하므로 제외)"""
+    if not selector:
+        return None
+    first = node.css_first(selector)
+    if first is None or first.mem_id != node.mem_id:
+        return first
+    # 첫 매칭이 node 자신인 경우에만 전체 매칭에서 다음 요소를 찾음
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+def lexbor_generate_selector(node: "LexborNode", cache: Optional[SelectorCache] = None) -> str:
+    """generate_selector의 lexbor 버전"""
+    if cache is None:
+        cache = SelectorCache()
+    chain = []
+    prefix = ""
+    current = node
+
+    while current is not None and current.tag != "-document":
+        key = current.mem_id
+        if key in cache.selectors:
+            prefix = cache.selectors[key]
+            break
+
+        attributes = current.attributes
+
+        element_id = attributes.get("id")
+        if element_id:
+            chain.append((key, f"#{element_id}"))
+            break
+
+        selector = current.tag + _class_suffix((attributes.get("class") or "").split())
+
+        parent = current.parent
+        if parent is not None:
+            positions = cache.positions.get(parent.mem_id)
+            if positions is None:
+                positions = cache.positions[parent.mem_id] = _sibling_positions(
+                    (s.mem_id, s.tag) for s in parent.iter()
+                )
+            index, count = positions[key]
+            if count > 1:
+                selector += f":nth-of-type({index})"
+
+        chain.append((key, selector))
+        current = parent
+
+    return _join_selector_chain(cache, chain, prefix)
+
+def first_img_src(html: str) -> str:
+    """HTML 조각에서 첫 번째 <img>의 src (없으면 빈 문자열)"""
+    if LexborHTMLParser is not None:
+        img = LexborHTMLParser(html, is_fragment=True).css_first("img")
+        return (img.attributes.get("src") or "") if img is not None else ""
+    # lexbor가 없으면 <img>만 트리로 만들어 찾음
+    img = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("img")).find("img")
+    return (img.get("src") or "") if img is not None else ""
+
+def lexbor_text(node: Optional["LexborNode"]) -> str:
+    """extract_text의 lexbor 버전"""
+    if node is None:
+        return ""
+    return node.text(strip=True)
+
+def _lexbor_attr(node: Optional["LexborNode"], tag: str, names: tuple[str, ...]) -> str:
+    """node 또는 첫 번째 하위 tag 요소에서 names 순서대로 속성값 추출"""
+    if node is None:
+        return ""
+    for target in (node, lexbor_select_one(node, tag)):
+        if target is None:
+            continue
+        for name in names:
+            value = target.attributes.get(name)
+            if value:
+                return value
+    return ""
+
+def lexbor_href(node: Optional["LexborNode"], base_url: str) -> str:
+    """extract_href의 lexbor 버전"""
+    href = _lexbor_attr(node, "a", ("href",))
+    return join_url(base_url, href) if href else ""
+
+def lexbor_src(node: Optional["LexborNode"], base_url: str) -> str:
+    """extract_src의 lexbor 버전"""
+    src = _lexbor_attr(node, "img", ("src", "data-src", "data-lazy-src"))
+    return join_url(base_url, src) if src else ""
+
+# ==========================================
+# 대용량 페이지 스트리밍 파싱
+# ==========================================
+
+# 이 크기(문자 수)를 넘는 목록 페이지는 전체 트리 대신 스트리밍으로 파싱
+STREAMING_PARSE_THRESHOLD = 1_000_000
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def stream_item_fragments(
+    html: str, item_selector: str, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Optional[Iterator[tuple[str, str]]]:
+    """
+    lxml 풀 파서에 HTML을 chunk 단위로 넣으며 아이템 요소를 (HTML, 부모 태그)로 하나씩 반환
+
+    단순 셀렉터(태그/클래스)만 지원하며 lxml이 없거나 셀렉터가 복잡하면 None.
+    처리가 끝난 요소는 바로 비워서 전체 트리를 메모리에 유지하지 않는다.
+    중첩된 아이템은 가장 바깥 요소만 반환한다.
+    """
+    simple = parse_simple_selector(item_selector)
+    if etree is None or simple is None:
+        return None
+    tag, class_name = simple
+
+    def matches(el) -> bool:
+        if tag is not None and el.tag != tag:
+            return False
+        return class_name is None or class_name in (el.get("class") or "").split()
+
+    def generate() -> Iterator[tuple[str, str]]:
+        # 입력은 이미 디코딩된 str이므로 UTF-8로 고정 (바이트나 meta charset으로 추측하지 않음)
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+        data = html.encode()
+        active = None
+        for offset in range(0, len(data) + chunk_size, chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            for event, el in parser.read_events():
+                if event == "start":
+                    if active is None and matches(el):
+                        active = el
+                    continue
+                if el is active:
+                    parent = el.getparent()
+                    yield (
+                        etree.tostring(
+                            el, encoding="unicode", method="html", with_tail=False
+                        ),
+                        parent.tag if parent is not None else "div",
+                    )
+                    active = None
+                if active is None:
+                    # 아이템 밖의 처리 끝난 요소와 앞선 형제들을 정리
+                    el.clear(keep_tail=True)
+                    parent = el.getparent()
+                    if parent is not None:
+                        while el.getprevious() is not None:
+                            del parent[0]
+            if not chunk:
+                break
+
+    return generate()
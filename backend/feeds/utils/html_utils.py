@@ -2,11 +2,19 @@
 import re
 from html import unescape
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax가 없으면 정규식 경로 사용
+    LexborHTMLParser = None
+
 
 def strip_html_tags(html: str) -> str:
     """
     HTML 문자열에서 태그를 제거하고 순수 텍스트만 반환합니다.
 
+    selectolax(lexbor)가 있으면 C 파서로 텍스트를 추출하고,
+    없으면 정규식으로 태그를 제거합니다.
+
     Args:
         html: HTML 문자열
 
@@ -16,6 +24,18 @@ def strip_html_tags(html: str) -> str:
     if not html:
         return ""
 
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html, is_fragment=True)
+        # script, style 태그와 그 내용 제거
+        tree.strip_tags(["script", "style"])
+        # 텍스트 노드 사이를 공백으로 잇고 연속된 공백은 하나로 (엔티티는 파서가 디코딩)
+        return " ".join(tree.text(separator=" ").split())
+
+    return _strip_html_tags_regex(html)
+
+
+def _strip_html_tags_regex(html: str) -> str:
+    """정규식 기반 태그 제거 (selectolax가 없을 때 사용)"""
     # script, style 태그와 그 내용 제거
     text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
     text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)